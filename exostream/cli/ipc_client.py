@@ -2,12 +2,14 @@
 
 import socket
 import json
+import itertools
+import threading
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import logging
 
 from exostream.common.protocol import (
-    RPCRequest, RPCResponse, RPCError,
+    RPCRequest, RPCResponse, RPCError, Methods,
     create_request
 )
 
@@ -43,7 +45,8 @@ class IPCClient:
     
     DEFAULT_SOCKET_PATH = "/tmp/exostream.sock"
     DEFAULT_TIMEOUT = 5.0  # seconds
-    BUFFER_SIZE = 4096
+    BUFFER_SIZE = 65536  # Dashboard responses with logs run to tens of KB
+    MAX_IDLE_CONNECTIONS = 4  # Open connections kept around for reuse
     
     def __init__(self, socket_path: Optional[str] = None, 
                  timeout: float = DEFAULT_TIMEOUT):
@@ -56,12 +59,15 @@ class IPCClient:
         """
         self.socket_path = socket_path or self.DEFAULT_SOCKET_PATH
         self.timeout = timeout
-        self._request_id = 0
+        # next() on a count is atomic, unlike += on an int attribute, so
+        # threads sharing the client (the GUI's workers) never reuse an id
+        self._request_ids = itertools.count(1)
+        self._idle_connections: List[socket.socket] = []
+        self._pool_lock = threading.Lock()
     
     def _get_next_id(self) -> int:
         """Get next request ID"""
-        self._request_id += 1
-        return self._request_id
+        return next(self._request_ids)
     
     def is_daemon_running(self) -> bool:
         """
@@ -106,7 +112,9 @@ class IPCClient:
         
         # Send request and receive response
         try:
-            response_data = self._send_and_receive(request.to_json(), timeout)
+            response_data = self._send_and_receive(
+                request.to_json(), timeout, method in Methods.IDEMPOTENT
+            )
         except socket.error as e:
             if e.errno == 2:  # No such file or directory
                 raise DaemonNotRunningError(
@@ -140,13 +148,21 @@ class IPCClient:
         
         return response.result
     
-    def _send_and_receive(self, data: str, timeout: float) -> str:
+    def _send_and_receive(self, data: str, timeout: float,
+                          idempotent: bool = False) -> str:
         """
         Send data and receive response via Unix socket
         
+        Connections are kept open and reused for later calls. Only requests
+        that are safe to run twice go over a reused connection: if it turns
+        out to be closed (idle timeout, daemon restarted) before any of the
+        reply arrived, the request is sent again on a fresh one. Everything
+        else always gets a fresh connection, so it is never resent.
+        
         Args:
             data: JSON string to send
             timeout: Timeout in seconds
+            idempotent: Whether the request may be sent twice
         
         Returns:
             Response data as string
@@ -155,6 +171,32 @@ class IPCClient:
             socket.error: On socket errors
             socket.timeout: On timeout
         """
+        logger.debug(f"Sending: {data[:200]}...")
+        payload = data.encode('utf-8') + b'\n'
+        
+        sock = self._checkout_connection() if idempotent else None
+        if sock is not None:
+            try:
+                sock.settimeout(timeout)
+                sock.sendall(payload)
+                first = sock.recv(self.BUFFER_SIZE)
+            except socket.timeout:
+                # The daemon may still be working on it, don't send it twice
+                sock.close()
+                raise
+            except OSError:
+                # Send failed or reset before any reply: a stale connection
+                first = b''
+            if first:
+                try:
+                    response = self._receive(sock, first)
+                except BaseException:
+                    sock.close()
+                    raise
+                return self._finish(sock, response)
+            sock.close()
+            logger.debug("Pooled connection was closed, reconnecting")
+        
         sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         try:
             sock.settimeout(timeout)
@@ -163,28 +205,70 @@ class IPCClient:
             logger.debug(f"Connecting to {self.socket_path}")
             sock.connect(self.socket_path)
             
-            # Send request
-            logger.debug(f"Sending: {data[:200]}...")
-            sock.sendall(data.encode('utf-8') + b'\n')
-            
-            # Receive response (may need multiple reads)
-            response_chunks = []
-            while True:
-                chunk = sock.recv(self.BUFFER_SIZE)
-                if not chunk:
-                    break
-                response_chunks.append(chunk)
-                
-                # Check if we have a complete JSON message
-                if chunk.endswith(b'\n') or chunk.endswith(b'}'):
-                    break
-            
-            response_data = b''.join(response_chunks).decode('utf-8').strip()
-            logger.debug(f"Received: {response_data[:200]}...")
-            
-            return response_data
-            
-        finally:
+            sock.sendall(payload)
+            response = self._receive(sock)
+        except BaseException:
+            sock.close()
+            raise
+        
+        return self._finish(sock, response)
+    
+    def _receive(self, sock: socket.socket, response: bytes = b'') -> bytes:
+        """
+        Read the rest of a response
+        
+        Args:
+            sock: Connection the request was sent on
+            response: Part of the response already read
+        
+        Returns:
+            Raw response, ending with a newline if it arrived complete.
+            Empty if the daemon closed the connection before answering.
+        """
+        # The daemon terminates every response with a newline. A chunk
+        # merely ending in '}' can be a cut inside a larger response.
+        response_chunks = [response]
+        while not response.endswith(b'\n'):
+            response = sock.recv(self.BUFFER_SIZE)
+            if not response:
+                break
+            response_chunks.append(response)
+        
+        return b''.join(response_chunks)
+    
+    def _finish(self, sock: socket.socket, response: bytes) -> str:
+        """Return a complete connection to the pool and decode the response"""
+        if response.endswith(b'\n'):
+            self._checkin_connection(sock)
+        else:
+            # Cut short, the connection is unusable for further requests
+            sock.close()
+        
+        response_data = response.decode('utf-8').strip()
+        logger.debug(f"Received: {response_data[:200]}...")
+        
+        return response_data
+    
+    def _checkout_connection(self) -> Optional[socket.socket]:
+        """Take an idle connection from the pool, if there is one"""
+        with self._pool_lock:
+            if self._idle_connections:
+                return self._idle_connections.pop()
+        return None
+    
+    def _checkin_connection(self, sock: socket.socket):
+        """Keep a connection for reuse, or close it if the pool is full"""
+        with self._pool_lock:
+            if len(self._idle_connections) < self.MAX_IDLE_CONNECTIONS:
+                self._idle_connections.append(sock)
+                return
+        sock.close()
+    
+    def close(self):
+        """Close all idle connections"""
+        with self._pool_lock:
+            connections, self._idle_connections = self._idle_connections, []
+        for sock in connections:
             sock.close()
     
     def call_with_retry(self, method: str, params: Optional[Dict[str, Any]] = None,
@@ -251,6 +335,10 @@ class IPCClientManager:
         """Check if daemon is running"""
         return self.client.is_daemon_running()
     
+    def close(self):
+        """Close the client's open connections"""
+        self.client.close()
+    
     def ping(self) -> bool:
         """
         Ping the daemon
@@ -266,7 +354,8 @@ class IPCClientManager:
     
     def start_stream(self, device: str, name: str, resolution: str = "1920x1080",
                     fps: int = 30, raw_input: bool = False,
-                    groups: Optional[str] = None) -> Dict[str, Any]:
+                    groups: Optional[str] = None, nice: int = 0,
+                    cpu_affinity: Optional[List[int]] = None) -> Dict[str, Any]:
         """
         Start streaming
         
@@ -277,6 +366,8 @@ class IPCClientManager:
             fps: Frames per second
             raw_input: Use raw YUYV input
             groups: NDI groups
+            nice: FFmpeg niceness (0 = unchanged)
+            cpu_affinity: CPU cores to pin FFmpeg to (None = all)
         
         Returns:
             Result dictionary
@@ -287,7 +378,9 @@ class IPCClientManager:
             'resolution': resolution,
             'fps': fps,
             'raw_input': raw_input,
-            'groups': groups
+            'groups': groups,
+            'nice': nice,
+            'cpu_affinity': cpu_affinity
         }
         # Use longer timeout for start command (10s) since FFmpeg startup can be slow
         return self.client.call("stream.start", params, timeout=10.0)
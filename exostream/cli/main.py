@@ -23,6 +23,11 @@ logger = get_logger(__name__)
 # Default socket path
 DEFAULT_SOCKET = "/tmp/exostream.sock"
 
+# How long `daemon start` waits for the daemon to answer, and the first
+# poll interval (doubled after every miss)
+DAEMON_START_TIMEOUT = 5.0  # seconds
+DAEMON_START_POLL_INTERVAL = 0.1  # seconds
+
 
 def get_client(socket_path: str = DEFAULT_SOCKET) -> IPCClientManager:
     """
@@ -56,6 +61,50 @@ def get_client(socket_path: str = DEFAULT_SOCKET) -> IPCClientManager:
     return client
 
 
+def parse_cpu_list(ctx, param, value):
+    """Parse a comma-separated CPU list like '2,3' (click callback)"""
+    if not value:
+        return None
+    try:
+        return [int(cpu) for cpu in value.split(',')]
+    except ValueError:
+        raise click.BadParameter(f"expected comma-separated CPU numbers, got '{value}'")
+
+
+def wait_for_daemon(client: IPCClientManager, process) -> bool:
+    """
+    Wait for a freshly started daemon to answer pings
+    
+    Polls quickly at first and backs off, so a daemon that comes up in a
+    few hundred milliseconds is reported right away while a slow start
+    still gets the full timeout.
+    
+    Args:
+        client: Client for the daemon's socket
+        process: The daemon's Popen object
+    
+    Returns:
+        True if the daemon responded, False if it exited or timed out
+    """
+    deadline = time.monotonic() + DAEMON_START_TIMEOUT
+    interval = DAEMON_START_POLL_INTERVAL
+    
+    while True:
+        if client.is_daemon_running():
+            return True
+        
+        # Exited already (bad arguments, socket in use...), no point waiting
+        if process.poll() is not None:
+            return False
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        
+        time.sleep(min(interval, remaining))
+        interval *= 2
+
+
 def handle_error(e: Exception, command: str):
     """
     Handle and display errors nicely
@@ -129,8 +178,10 @@ def cli(ctx, socket, verbose):
 @click.option('--fps', '-f', default=30, type=int, help='Frames per second')
 @click.option('--raw-input', is_flag=True, help='Use raw YUYV input (720p recommended)')
 @click.option('--groups', '-g', help='NDI groups (comma-separated)')
+@click.option('--nice', default=0, type=int, help='FFmpeg niceness (negative needs CAP_SYS_NICE)')
+@click.option('--cpus', callback=parse_cpu_list, help='CPU cores to pin FFmpeg to (e.g. 2,3)')
 @click.pass_context
-def start(ctx, device, name, resolution, fps, raw_input, groups):
+def start(ctx, device, name, resolution, fps, raw_input, groups, nice, cpus):
     """Start streaming to NDI"""
     
     console.print()
@@ -156,6 +207,10 @@ def start(ctx, device, name, resolution, fps, raw_input, groups):
             console.print(f"  Input: [cyan]Raw YUYV[/cyan]")
         else:
             console.print(f"  Input: [cyan]MJPEG[/cyan]")
+        if nice:
+            console.print(f"  Niceness: [cyan]{nice}[/cyan]")
+        if cpus:
+            console.print(f"  CPUs: [cyan]{','.join(map(str, cpus))}[/cyan]")
         console.print()
         
         # Start streaming
@@ -166,7 +221,9 @@ def start(ctx, device, name, resolution, fps, raw_input, groups):
                 resolution=resolution,
                 fps=fps,
                 raw_input=raw_input,
-                groups=groups
+                groups=groups,
+                nice=nice,
+                cpu_affinity=cpus
             )
         
         # Success!
@@ -501,11 +558,8 @@ def daemon_start(socket, state_dir, verbose):
                 start_new_session=True  # Detach from terminal
             )
             
-            # Wait a moment for it to start
-            time.sleep(1.0)
-            
-            # Check if it's running
-            if client.is_daemon_running():
+            # Wait for it to come up
+            if wait_for_daemon(client, process):
                 console.print(Panel(
                     f"[green]✓ Daemon started successfully[/green]\n\n"
                     f"Socket: [cyan]{socket}[/cyan]\n\n"
@@ -2,11 +2,13 @@
 
 import socket
 import json
+import itertools
 import logging
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, List, Set
 
 from exostream.common.protocol import (
-    RPCRequest, RPCResponse, RPCError,
+    RPCRequest, RPCResponse, RPCError, Methods,
     create_request
 )
 
@@ -41,7 +43,8 @@ class NetworkClient:
     """Client for remote control via TCP socket"""
     
     DEFAULT_TIMEOUT = 10.0  # seconds
-    BUFFER_SIZE = 4096
+    BUFFER_SIZE = 65536  # Dashboard responses with logs run to tens of KB
+    MAX_IDLE_CONNECTIONS = 4  # One per GUI worker thread
     
     def __init__(self, host: str, port: int = 9023,
                  timeout: float = DEFAULT_TIMEOUT):
@@ -56,12 +59,17 @@ class NetworkClient:
         self.host = host
         self.port = port
         self.timeout = timeout
-        self._request_id = 0
+        # next() on a count is atomic, unlike += on an int attribute, so
+        # threads sharing the client (the GUI's workers) never reuse an id
+        self._request_ids = itertools.count(1)
+        self._idle_connections: List[socket.socket] = []
+        self._busy_connections: Set[socket.socket] = set()  # Requests in flight
+        self._closed = False
+        self._pool_lock = threading.Lock()
     
     def _get_next_id(self) -> int:
         """Get next request ID"""
-        self._request_id += 1
-        return self._request_id
+        return next(self._request_ids)
     
     def is_connected(self) -> bool:
         """
@@ -106,7 +114,9 @@ class NetworkClient:
         
         # Send request and receive response
         try:
-            response_data = self._send_and_receive(request.to_json(), timeout)
+            response_data = self._send_and_receive(
+                request.to_json(), timeout, method in Methods.IDEMPOTENT
+            )
         except socket.timeout:
             raise NetworkTimeoutError(
                 f"Server did not respond within {timeout} seconds"
@@ -139,13 +149,21 @@ class NetworkClient:
         
         return response.result
     
-    def _send_and_receive(self, data: str, timeout: float) -> str:
+    def _send_and_receive(self, data: str, timeout: float,
+                          idempotent: bool = False) -> str:
         """
         Send data and receive response via TCP socket
         
+        Connections are kept open and reused for later calls. Only requests
+        that are safe to run twice go over a reused connection: if it turns
+        out to be closed (idle timeout, server restarted) before any of the
+        reply arrived, the request is sent again on a fresh one. Everything
+        else always gets a fresh connection, so it is never resent.
+        
         Args:
             data: JSON string to send
             timeout: Timeout in seconds
+            idempotent: Whether the request may be sent twice
         
         Returns:
             Response data as string
@@ -154,38 +172,141 @@ class NetworkClient:
             socket.error: On socket errors
             socket.timeout: On timeout
         """
+        logger.debug(f"Sending: {data[:200]}...")
+        payload = data.encode('utf-8') + b'\n'
+        
+        sock = self._checkout_connection() if idempotent else None
+        if sock is not None:
+            try:
+                sock.settimeout(timeout)
+                sock.sendall(payload)
+                first = sock.recv(self.BUFFER_SIZE)
+            except socket.timeout:
+                # The server may still be working on it, don't send it twice
+                self._drop_connection(sock)
+                raise
+            except OSError:
+                # Send failed or reset before any reply: a stale connection
+                first = b''
+            if first:
+                try:
+                    response = self._receive(sock, first)
+                except BaseException:
+                    self._drop_connection(sock)
+                    raise
+                return self._finish(sock, response)
+            self._drop_connection(sock)
+            logger.debug("Pooled connection was closed, reconnecting")
+        
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._track_connection(sock)
         try:
             sock.settimeout(timeout)
             
+            # Requests are small and latency-bound, don't let Nagle hold them back
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            
             # Connect to server
             logger.debug(f"Connecting to {self.host}:{self.port}")
             sock.connect((self.host, self.port))
             
-            # Send request
-            logger.debug(f"Sending: {data[:200]}...")
-            sock.sendall(data.encode('utf-8') + b'\n')
-            
-            # Receive response (may need multiple reads)
-            response_chunks = []
-            while True:
-                chunk = sock.recv(self.BUFFER_SIZE)
-                if not chunk:
-                    break
-                response_chunks.append(chunk)
-                
-                # Check if we have a complete JSON message
-                if chunk.endswith(b'\n') or chunk.endswith(b'}'):
-                    break
-            
-            response_data = b''.join(response_chunks).decode('utf-8').strip()
-            logger.debug(f"Received: {response_data[:200]}...")
-            
-            return response_data
-            
-        finally:
+            sock.sendall(payload)
+            response = self._receive(sock)
+        except BaseException:
+            self._drop_connection(sock)
+            raise
+        
+        return self._finish(sock, response)
+    
+    def _receive(self, sock: socket.socket, response: bytes = b'') -> bytes:
+        """
+        Read the rest of a response
+        
+        Args:
+            sock: Connection the request was sent on
+            response: Part of the response already read
+        
+        Returns:
+            Raw response, ending with a newline if it arrived complete.
+            Empty if the server closed the connection before answering.
+        """
+        # The server terminates every response with a newline. A chunk
+        # merely ending in '}' can be a cut inside a larger response.
+        response_chunks = [response]
+        while not response.endswith(b'\n'):
+            response = sock.recv(self.BUFFER_SIZE)
+            if not response:
+                break
+            response_chunks.append(response)
+        
+        return b''.join(response_chunks)
+    
+    def _finish(self, sock: socket.socket, response: bytes) -> str:
+        """Return a complete connection to the pool and decode the response"""
+        if response.endswith(b'\n'):
+            self._checkin_connection(sock)
+        else:
+            # Cut short, the connection is unusable for further requests
+            self._drop_connection(sock)
+        
+        response_data = response.decode('utf-8').strip()
+        logger.debug(f"Received: {response_data[:200]}...")
+        
+        return response_data
+    
+    def _checkout_connection(self) -> Optional[socket.socket]:
+        """Take an idle connection from the pool, if there is one"""
+        with self._pool_lock:
+            if self._idle_connections:
+                sock = self._idle_connections.pop()
+                self._busy_connections.add(sock)
+                return sock
+        return None
+    
+    def _track_connection(self, sock: socket.socket):
+        """Register a new connection so close() can interrupt its request"""
+        with self._pool_lock:
+            if not self._closed:
+                self._busy_connections.add(sock)
+                return
+        sock.close()
+        raise ConnectionAbortedError("Client has been closed")
+    
+    def _checkin_connection(self, sock: socket.socket):
+        """Keep a connection for reuse, or close it if the pool is full"""
+        with self._pool_lock:
+            self._busy_connections.discard(sock)
+            if not self._closed and len(self._idle_connections) < self.MAX_IDLE_CONNECTIONS:
+                self._idle_connections.append(sock)
+                return
+        sock.close()
+    
+    def _drop_connection(self, sock: socket.socket):
+        """Close a connection that can't be reused"""
+        with self._pool_lock:
+            self._busy_connections.discard(sock)
+        sock.close()
+    
+    def close(self):
+        """
+        Close all connections
+        
+        Calls still waiting for a reply are woken up and fail, so threads
+        blocked on the client don't hold up shutdown. The client can't be
+        used afterwards.
+        """
+        with self._pool_lock:
+            self._closed = True
+            idle, self._idle_connections = self._idle_connections, []
+            busy = list(self._busy_connections)
+        for sock in idle:
             sock.close()
-
+        for sock in busy:
+            # The calling thread closes it once its recv() returns
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass  # Not connected yet, or already closed
 
 class NetworkClientManager:
     """High-level manager for network client with method helpers"""
@@ -204,6 +325,10 @@ class NetworkClientManager:
         """Check if connected to server"""
         return self.client.is_connected()
     
+    def close(self):
+        """Close the client's open connections"""
+        self.client.close()
+    
     def ping(self) -> bool:
         """
         Ping the server
@@ -276,7 +401,8 @@ class NetworkClientManager:
     
     def start_stream(self, device: str, name: str, resolution: str = "1920x1080",
                     fps: int = 30, raw_input: bool = False,
-                    groups: Optional[str] = None) -> Dict[str, Any]:
+                    groups: Optional[str] = None, nice: int = 0,
+                    cpu_affinity: Optional[List[int]] = None) -> Dict[str, Any]:
         """
         Start streaming
         
@@ -287,6 +413,8 @@ class NetworkClientManager:
             fps: Frames per second
             raw_input: Use raw YUYV input
             groups: NDI groups
+            nice: FFmpeg niceness (0 = unchanged)
+            cpu_affinity: CPU cores to pin FFmpeg to (None = all)
         
         Returns:
             Result dictionary
@@ -297,7 +425,9 @@ class NetworkClientManager:
             'resolution': resolution,
             'fps': fps,
             'raw_input': raw_input,
-            'groups': groups
+            'groups': groups,
+            'nice': nice,
+            'cpu_affinity': cpu_affinity
         }
         return self.client.call("stream.start", params, timeout=15.0)
     
@@ -338,21 +468,59 @@ class NetworkClientManager:
         """
         return self.client.call("daemon.status", {})
     
-    def get_logs(self, level: Optional[str] = None, lines: Optional[int] = None) -> Dict[str, Any]:
+    def get_logs(self, level: Optional[str] = None, lines: Optional[int] = None,
+                 since_seq: Optional[int] = None,
+                 component: Optional[str] = None) -> Dict[str, Any]:
         """
         Get daemon logs
         
         Args:
             level: Filter by log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
             lines: Number of lines to retrieve (default: all)
+            since_seq: Only return lines written after this cursor
+                       (the 'next_seq' of a previous call)
+            component: Only return lines mentioning this component (e.g. "tcp", "ffmpeg")
         
         Returns:
-            Dictionary with logs array and metadata
+            Dictionary with logs array and metadata. 'next_seq' is the cursor
+            for the next call; 'since_seq' is None if the logs were read from
+            the start (no cursor given, or the log file was rotated).
         """
         params = {}
         if level:
             params['level'] = level
         if lines:
             params['lines'] = lines
+        if since_seq is not None:
+            params['since_seq'] = since_seq
+        if component:
+            params['component'] = component
         return self.client.call("logs.get", params)
-
+    
+    def get_dashboard(self, include_logs: bool = False,
+                      level: Optional[str] = None,
+                      lines: Optional[int] = None,
+                      component: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get daemon status, settings, devices and available options in one call
+        
+        Args:
+            include_logs: Also fetch daemon logs (returned under 'log')
+            level: Filter logs by level (only used with include_logs)
+            lines: Number of log lines to retrieve (only used with include_logs)
+            component: Filter logs by component (only used with include_logs)
+        
+        Returns:
+            Dictionary with 'daemon', 'settings', 'devices', 'options'
+            and optionally 'log' entries
+        """
+        params = {}
+        if include_logs:
+            params['include_logs'] = True
+            if level:
+                params['level'] = level
+            if lines:
+                params['lines'] = lines
+            if component:
+                params['component'] = component
+        return self.client.call("dashboard.get", params)
@@ -1,7 +1,7 @@
 """Configuration management"""
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 import yaml
 from pathlib import Path
 
@@ -14,6 +14,8 @@ class VideoConfig:
     fps: int = 30
     bitrate: int = 6000  # kbps (increased for better quality with software encoder)
     keyframe_interval: int = 30  # GOP size (1 second at 30fps)
+    nice: int = 0  # FFmpeg scheduling priority (negative needs CAP_SYS_NICE)
+    cpu_affinity: Optional[Tuple[int, ...]] = None  # CPU cores to pin FFmpeg to (None = all)
     
     @property
     def resolution(self) -> str:
@@ -76,6 +78,8 @@ class StreamConfig:
                 'fps': self.video.fps,
                 'bitrate': self.video.bitrate,
                 'keyframe_interval': self.video.keyframe_interval,
+                'nice': self.video.nice,
+                'cpu_affinity': list(self.video.cpu_affinity) if self.video.cpu_affinity else None,
             },
             'ndi': {
                 'stream_name': self.ndi.stream_name,
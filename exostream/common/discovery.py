@@ -262,9 +262,17 @@ class ExostreamServiceDiscovery:
                 now = time.time()
                 
                 with self.services_lock:
-                    if service_key in self.services:
+                    old_service = self.services.get(service_key)
+                    if (old_service is not None and old_service.name == name and
+                            old_service.hostname == hostname and
+                            old_service.version == version):
+                        # Periodic re-announcement, only the timestamp
+                        # moves so there's nothing to tell the callback
+                        old_service.last_seen = now
+                        continue
+                    
+                    if old_service is not None:
                         # Update existing service
-                        old_service = self.services[service_key]
                         self.services[service_key] = ExostreamServiceInfo(
                             name=name,
                             hostname=hostname,
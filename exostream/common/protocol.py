@@ -1,10 +1,32 @@
 """IPC Protocol definitions for communication between CLI and daemon"""
 
 from dataclasses import dataclass, asdict
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from enum import Enum
 import json
 
+# orjson is optional: several times faster than the stdlib json module and
+# a drop-in for what goes over the wire here. Its JSONDecodeError subclasses
+# json.JSONDecodeError, so callers catching that keep working.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize a JSON-RPC message to a string"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj)
+
+
+def json_loads(data):
+    """Parse a JSON-RPC message from str or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class RPCError(Enum):
     """Standard JSON-RPC 2.0 error codes"""
@@ -33,12 +55,18 @@ class RPCRequest:
     
     def to_json(self) -> str:
         """Convert to JSON string"""
-        return json.dumps(asdict(self))
+        # Built by hand, asdict() would deep-copy params for nothing
+        return json_dumps({
+            'method': self.method,
+            'params': self.params,
+            'id': self.id,
+            'jsonrpc': self.jsonrpc
+        })
     
     @classmethod
-    def from_json(cls, data: str) -> 'RPCRequest':
-        """Parse from JSON string"""
-        obj = json.loads(data)
+    def from_json(cls, data: Union[str, bytes]) -> 'RPCRequest':
+        """Parse from JSON string (or UTF-8 bytes)"""
+        obj = json_loads(data)
         return cls(
             method=obj['method'],
             params=obj.get('params', {}),
@@ -65,12 +93,12 @@ class RPCResponse:
             data['error'] = self.error
         else:
             data['result'] = self.result
-        return json.dumps(data)
+        return json_dumps(data)
     
     @classmethod
-    def from_json(cls, data: str) -> 'RPCResponse':
-        """Parse from JSON string"""
-        obj = json.loads(data)
+    def from_json(cls, data: Union[str, bytes]) -> 'RPCResponse':
+        """Parse from JSON string (or UTF-8 bytes)"""
+        obj = json_loads(data)
         return cls(
             result=obj.get('result'),
             error=obj.get('error'),
@@ -110,6 +138,8 @@ class StartStreamParams:
     fps: int = 30
     raw_input: bool = False
     groups: Optional[str] = None
+    nice: int = 0  # FFmpeg niceness (0 = unchanged)
+    cpu_affinity: Optional[List[int]] = None  # CPU cores to pin FFmpeg to (None = all)
     
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -122,7 +152,9 @@ class StartStreamParams:
             resolution=data.get('resolution', '1920x1080'),
             fps=data.get('fps', 30),
             raw_input=data.get('raw_input', False),
-            groups=data.get('groups')
+            groups=data.get('groups'),
+            nice=data.get('nice', 0),
+            cpu_affinity=data.get('cpu_affinity')
         )
 
 
@@ -257,6 +289,8 @@ class GetLogsParams:
     """Parameters for logs.get method"""
     level: Optional[str] = None  # Filter by level: DEBUG, INFO, WARNING, ERROR, CRITICAL
     lines: Optional[int] = None  # Number of lines to retrieve (default: all)
+    since_seq: Optional[int] = None  # Only return lines after this cursor (next_seq of a previous call)
+    component: Optional[str] = None  # Only return lines mentioning this component (e.g. tcp, ffmpeg)
     
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -265,7 +299,30 @@ class GetLogsParams:
     def from_dict(cls, data: Dict[str, Any]) -> 'GetLogsParams':
         return cls(
             level=data.get('level'),
-            lines=data.get('lines')
+            lines=data.get('lines'),
+            since_seq=data.get('since_seq'),
+            component=data.get('component')
+        )
+
+
+@dataclass
+class GetDashboardParams:
+    """Parameters for dashboard.get method"""
+    include_logs: bool = False  # Also return a logs.get result under 'log'
+    level: Optional[str] = None  # Log level filter (only used with include_logs)
+    lines: Optional[int] = None  # Number of log lines (only used with include_logs)
+    component: Optional[str] = None  # Log component filter (only used with include_logs)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'GetDashboardParams':
+        return cls(
+            include_logs=data.get('include_logs', False),
+            level=data.get('level'),
+            lines=data.get('lines'),
+            component=data.get('component')
         )
 
 
@@ -295,6 +352,16 @@ class Methods:
     
     # Logs
     LOGS_GET = "logs.get"
+    
+    # Batched status (daemon + settings + devices + options [+ logs])
+    DASHBOARD_GET = "dashboard.get"
+    
+    # Read-only methods: running one twice is harmless, so a client may
+    # resend it when a reused connection turns out to be closed
+    IDEMPOTENT = frozenset({
+        STREAM_STATUS, DEVICES_LIST, SETTINGS_GET, SETTINGS_GET_AVAILABLE,
+        DAEMON_STATUS, DAEMON_PING, LOGS_GET, DASHBOARD_GET,
+    })
 
 
 # ============================================================================
@@ -1,8 +1,10 @@
 """IPC Server using Unix Domain Sockets"""
 
+import select
 import socket
 import os
 import threading
+import time
 import logging
 from pathlib import Path
 from typing import Optional, Callable, Dict, Any
@@ -10,7 +12,7 @@ import json
 import traceback
 
 from exostream.common.protocol import (
-    RPCRequest, RPCResponse, RPCError,
+    RPCRequest, RPCResponse, RPCError, json_loads,
     create_error_response
 )
 
@@ -22,6 +24,7 @@ class IPCServer:
     
     DEFAULT_SOCKET_PATH = "/tmp/exostream.sock"  # Will use /var/run in production
     BUFFER_SIZE = 4096
+    IDLE_TIMEOUT = 60.0  # seconds before an idle client connection is closed
     
     def __init__(self, socket_path: Optional[str] = None, 
                  handler: Optional[Callable] = None):
@@ -149,68 +152,60 @@ class IPCServer:
         logger.debug("Accept loop stopped")
     
     def _handle_client(self, client_socket: socket.socket):
-        """Handle a client connection"""
-        thread_id = threading.get_ident()
+        """
+        Handle a client connection
+        
+        Clients may send several newline-terminated requests over one
+        connection. It is closed when the client closes it, after
+        IDLE_TIMEOUT seconds without a request, or when the server stops.
+        """
+        # Same key the accept loop registered this thread under, so the
+        # entry is actually removed when the client is done
+        thread_id = id(threading.current_thread())
         logger.debug(f"Client connected (thread {thread_id})")
         
+        # Blocking, so sending a large response to a slow reader isn't cut
+        # off; waiting for the next request is done with select() below
+        client_socket.setblocking(True)
+        buffer = b''
+        handled = 0
+        last_activity = time.monotonic()
+        
         try:
-            # Receive data (may need multiple reads for large messages)
-            data_chunks = []
-            while True:
+            while self.running:
+                # Poll once a second so idle connections notice the server stopping
+                readable, _, _ = select.select([client_socket], [], [], 1.0)
+                if not readable:
+                    if time.monotonic() - last_activity > self.IDLE_TIMEOUT:
+                        break
+                    continue
+                
                 chunk = client_socket.recv(self.BUFFER_SIZE)
                 if not chunk:
+                    # Client closed its side, an unterminated request may be left
+                    if buffer.strip():
+                        self._handle_request(client_socket, buffer)
+                        handled += 1
                     break
-                data_chunks.append(chunk)
+                last_activity = time.monotonic()
+                buffer += chunk
                 
-                # Check if we have a complete JSON message
-                # (ends with newline or closing brace)
-                if chunk.endswith(b'\n') or chunk.endswith(b'}'):
-                    break
+                # Handle every complete request received so far
+                while b'\n' in buffer:
+                    line, _, buffer = buffer.partition(b'\n')
+                    if line.strip():
+                        self._handle_request(client_socket, line)
+                        handled += 1
+                
+                # Clients that don't terminate a request with a newline and
+                # wait for the response (a bare JSON object used to be enough)
+                if buffer.endswith(b'}') and self._is_complete_json(buffer):
+                    line, buffer = buffer, b''
+                    self._handle_request(client_socket, line)
+                    handled += 1
             
-            if not data_chunks:
+            if not handled and not buffer.strip():
                 logger.debug("Client disconnected without sending data")
-                return
-            
-            data = b''.join(data_chunks).decode('utf-8')
-            logger.debug(f"Received: {data[:200]}...")  # Log first 200 chars
-            
-            # Parse request
-            try:
-                request = RPCRequest.from_json(data)
-                logger.debug(f"Parsed request: method={request.method}, id={request.id}")
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON parse error: {e}")
-                response = create_error_response(
-                    RPCError.PARSE_ERROR,
-                    f"Invalid JSON: {str(e)}"
-                )
-                self._send_response(client_socket, response)
-                return
-            except Exception as e:
-                logger.error(f"Request parse error: {e}")
-                response = create_error_response(
-                    RPCError.INVALID_REQUEST,
-                    f"Invalid request: {str(e)}"
-                )
-                self._send_response(client_socket, response)
-                return
-            
-            # Handle request
-            try:
-                response = self.handler(request)
-                logger.debug(f"Handler returned response for request {request.id}")
-            except Exception as e:
-                logger.error(f"Handler error: {e}")
-                logger.debug(traceback.format_exc())
-                response = create_error_response(
-                    RPCError.INTERNAL_ERROR,
-                    f"Internal error: {str(e)}",
-                    data={'traceback': traceback.format_exc()},
-                    request_id=request.id
-                )
-            
-            # Send response
-            self._send_response(client_socket, response)
             
         except Exception as e:
             logger.error(f"Error handling client: {e}")
@@ -222,6 +217,58 @@ class IPCServer:
                     del self._client_handlers[thread_id]
             logger.debug(f"Client disconnected (thread {thread_id})")
     
+    @staticmethod
+    def _is_complete_json(data: bytes) -> bool:
+        """Check whether an unterminated request is a whole JSON document"""
+        try:
+            json_loads(data)
+            return True
+        except ValueError:
+            return False
+    
+    def _handle_request(self, client_socket: socket.socket, data: bytes):
+        """Parse and handle one request, then send its response"""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Received: {data[:200].decode('utf-8', 'replace')}...")
+        
+        # Parse request
+        try:
+            request = RPCRequest.from_json(data)
+            logger.debug(f"Parsed request: method={request.method}, id={request.id}")
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON parse error: {e}")
+            response = create_error_response(
+                RPCError.PARSE_ERROR,
+                f"Invalid JSON: {str(e)}"
+            )
+            self._send_response(client_socket, response)
+            return
+        except Exception as e:
+            logger.error(f"Request parse error: {e}")
+            response = create_error_response(
+                RPCError.INVALID_REQUEST,
+                f"Invalid request: {str(e)}"
+            )
+            self._send_response(client_socket, response)
+            return
+        
+        # Handle request
+        try:
+            response = self.handler(request)
+            logger.debug(f"Handler returned response for request {request.id}")
+        except Exception as e:
+            logger.error(f"Handler error: {e}")
+            logger.debug(traceback.format_exc())
+            response = create_error_response(
+                RPCError.INTERNAL_ERROR,
+                f"Internal error: {str(e)}",
+                data={'traceback': traceback.format_exc()},
+                request_id=request.id
+            )
+        
+        # Send response
+        self._send_response(client_socket, response)
+    
     def _send_response(self, client_socket: socket.socket, response: RPCResponse):
         """Send response to client"""
         try:
@@ -257,22 +304,27 @@ class IPCServerManager:
             handler: Callable that takes params dict and returns result
         """
         with self._lock:
-            self._handlers[method] = handler
+            # Copy-on-write so routing can read the table without the lock
+            handlers = dict(self._handlers)
+            handlers[method] = handler
+            self._handlers = handlers
             logger.debug(f"Registered handler for method: {method}")
     
     def unregister_handler(self, method: str):
         """Unregister a handler"""
         with self._lock:
             if method in self._handlers:
-                del self._handlers[method]
+                handlers = dict(self._handlers)
+                del handlers[method]
+                self._handlers = handlers
                 logger.debug(f"Unregistered handler for method: {method}")
     
     def _route_request(self, request: RPCRequest) -> RPCResponse:
         """Route request to appropriate handler"""
         logger.debug(f"Routing request: method={request.method}")
         
-        with self._lock:
-            handler = self._handlers.get(request.method)
+        # The table is replaced, never mutated, so no lock needed here
+        handler = self._handlers.get(request.method)
         
         if not handler:
             logger.warning(f"No handler for method: {request.method}")
@@ -1,6 +1,7 @@
 """Main daemon entry point"""
 
 import os
+import re
 import sys
 import signal
 import logging
@@ -26,7 +27,8 @@ from exostream.common.protocol import (
     StartStreamParams,
     StopStreamParams,
     UpdateSettingsParams,
-    GetLogsParams
+    GetLogsParams,
+    GetDashboardParams
 )
 from exostream.common.config import NetworkConfig
 from exostream.common.discovery import ExostreamServicePublisher
@@ -37,6 +39,22 @@ __version__ = "0.3.0"
 
 logger = get_logger(__name__)
 
+LOG_LEVEL_PRIORITY = {
+    'DEBUG': 0,
+    'INFO': 1,
+    'WARNING': 2,
+    'ERROR': 3,
+    'CRITICAL': 4
+}
+
+# Level of a log line in either format, with a single match() per line:
+#   YYYY-MM-DD HH:MM:SS - logger_name - LEVEL - message  (group 1, anywhere in the line)
+#   [HH:MM:SS] LEVEL message                             (group 2, at the start)
+LOG_LEVEL_PATTERN = re.compile(
+    r'(?=.*? - [^-]+ - (DEBUG|INFO|WARNING|ERROR|CRITICAL) - )'
+    r'|\[.*?\] (DEBUG|INFO|WARNING|ERROR|CRITICAL) '
+)
+
 
 class ExostreamDaemon:
     """
@@ -155,6 +173,12 @@ class ExostreamDaemon:
             self._handle_logs_get
         )
         
+        # Batched status for remote dashboards
+        self.ipc_server.register_handler(
+            Methods.DASHBOARD_GET,
+            self._handle_dashboard_get
+        )
+        
         # Register same handlers for TCP server (network control)
         if self.network_config.enabled:
             self.tcp_server.register_handler(Methods.STREAM_START, self._handle_stream_start)
@@ -167,6 +191,7 @@ class ExostreamDaemon:
             self.tcp_server.register_handler(Methods.DAEMON_STATUS, self._handle_daemon_status)
             self.tcp_server.register_handler(Methods.DAEMON_PING, self._handle_daemon_ping)
             self.tcp_server.register_handler(Methods.LOGS_GET, self._handle_logs_get)
+            self.tcp_server.register_handler(Methods.DASHBOARD_GET, self._handle_dashboard_get)
             logger.info("TCP server handlers registered")
         
         logger.info("RPC handlers registered")
@@ -204,7 +229,9 @@ class ExostreamDaemon:
                 resolution=stream_params.resolution,
                 fps=stream_params.fps,
                 raw_input=stream_params.raw_input,
-                groups=stream_params.groups
+                groups=stream_params.groups,
+                nice=stream_params.nice,
+                cpu_affinity=stream_params.cpu_affinity
             )
             return result
         except StreamAlreadyRunningError as e:
@@ -354,10 +381,10 @@ class ExostreamDaemon:
         Handle logs.get method
         
         Args:
-            params: Log retrieval parameters (level, lines)
+            params: Log retrieval parameters (level, lines, since_seq, component)
         
         Returns:
-            Dictionary with log entries
+            Dictionary with log entries and the next_seq cursor
         """
         logger.debug("RPC: logs.get called")
         
@@ -376,50 +403,45 @@ class ExostreamDaemon:
                     "message": "Log file does not exist"
                 }
             
+            # Resume from the cursor if given, unless the file shrank (rotated)
+            since_seq = log_params.since_seq
+            if since_seq is not None and not 0 <= since_seq <= log_path.stat().st_size:
+                since_seq = None
+            start = since_seq or 0
+            
             # Read log file
-            with open(log_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            with open(log_path, 'rb') as f:
+                f.seek(start)
+                data = f.read()
+            
+            # Only consume complete lines, a partially written one is picked up next time
+            end = data.rfind(b'\n') + 1
+            next_seq = start + end
+            lines = data[:end].decode('utf-8', errors='replace').split('\n')[:-1]
             
             # Filter by level if specified
             if log_params.level:
-                import re
                 level_upper = log_params.level.upper()
-                level_priority = {
-                    'DEBUG': 0,
-                    'INFO': 1,
-                    'WARNING': 2,
-                    'ERROR': 3,
-                    'CRITICAL': 4
-                }
-                requested_priority = level_priority.get(level_upper, 1)
+                requested_priority = LOG_LEVEL_PRIORITY.get(level_upper, 1)
                 
                 filtered_lines = []
                 for line in lines:
-                    line_level = None
-                    line_priority = 999  # Default to exclude if not found
+                    match = LOG_LEVEL_PATTERN.match(line)
+                    if not match:
+                        continue  # Exclude lines without a level
                     
-                    # Match log format: YYYY-MM-DD HH:MM:SS - logger_name - LEVEL - message
-                    # The level must appear between the second and third dash
-                    # Pattern: ... - logger - LEVEL - ...
-                    pattern = r' - [^-]+ - (DEBUG|INFO|WARNING|ERROR|CRITICAL) - '
-                    match = re.search(pattern, line)
-                    if match:
-                        line_level = match.group(1)
-                        line_priority = level_priority.get(line_level, 999)
-                    else:
-                        # Fallback: try to match level at start of line for different formats
-                        # Pattern: [HH:MM:SS] LEVEL message
-                        pattern2 = r'^\[.*?\] (DEBUG|INFO|WARNING|ERROR|CRITICAL) '
-                        match2 = re.match(pattern2, line)
-                        if match2:
-                            line_level = match2.group(1)
-                            line_priority = level_priority.get(line_level, 999)
-                    
-                    # Only include if line priority >= requested priority (and we found a level)
-                    if line_level and line_priority >= requested_priority:
+                    # Only include if line priority >= requested priority
+                    line_level = match.group(1) or match.group(2)
+                    if LOG_LEVEL_PRIORITY[line_level] >= requested_priority:
                         filtered_lines.append(line)
                 lines = filtered_lines
             
+            # Filter by component if specified
+            if log_params.component:
+                # Case-insensitive substring, so "tcp" also covers tcp_server
+                component = log_params.component.lower()
+                lines = [line for line in lines if component in line.lower()]
+            
             # Limit number of lines if specified
             if log_params.lines and log_params.lines > 0:
                 lines = lines[-log_params.lines:]  # Get last N lines
@@ -428,7 +450,10 @@ class ExostreamDaemon:
                 "logs": [line.rstrip('\n') for line in lines],
                 "total_lines": len(lines),
                 "filtered_by": log_params.level,
-                "requested_lines": log_params.lines
+                "component": log_params.component,
+                "requested_lines": log_params.lines,
+                "since_seq": since_seq,
+                "next_seq": next_seq
             }
             
         except Exception as e:
@@ -555,6 +580,41 @@ class ExostreamDaemon:
             logger.error(f"Error getting available options: {e}")
             raise StreamingError(f"Failed to get available options: {e}")
     
+    def _handle_dashboard_get(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle dashboard.get method
+        
+        Combines daemon.status, settings.get, devices.list and
+        settings.get_available (and optionally logs.get) into a single
+        response so remote clients can refresh with one round-trip.
+        
+        Args:
+            params: Dashboard parameters (include_logs, level, lines, component)
+        
+        Returns:
+            Dictionary with daemon, settings, devices, options and log entries
+        """
+        logger.debug("RPC: dashboard.get called")
+        
+        dashboard_params = GetDashboardParams.from_dict(params)
+        
+        dashboard = {
+            "daemon": self._handle_daemon_status({}),
+            "settings": self._handle_settings_get({}),
+            "devices": self._handle_devices_list({})["devices"],
+            "options": self._handle_settings_get_available({})
+        }
+        
+        if dashboard_params.include_logs:
+            log_params = GetLogsParams(
+                level=dashboard_params.level,
+                lines=dashboard_params.lines,
+                component=dashboard_params.component
+            )
+            dashboard["log"] = self._handle_logs_get(log_params.to_dict())
+        
+        return dashboard
+    
     # ========================================================================
     # Daemon Lifecycle
     # ========================================================================
@@ -97,7 +97,8 @@ class StreamingService:
     
     def start_streaming(self, device: str, name: str, resolution: str = "1920x1080",
                        fps: int = 30, raw_input: bool = False,
-                       groups: Optional[str] = None) -> Dict[str, Any]:
+                       groups: Optional[str] = None, nice: int = 0,
+                       cpu_affinity: Optional[List[int]] = None) -> Dict[str, Any]:
         """
         Start streaming on a specific device
         
@@ -108,6 +109,8 @@ class StreamingService:
             fps: Frames per second
             raw_input: Use raw YUYV input
             groups: NDI groups
+            nice: FFmpeg niceness (0 = unchanged)
+            cpu_affinity: CPU cores to pin FFmpeg to (None = all)
         
         Returns:
             Result dictionary with status
@@ -151,7 +154,9 @@ class StreamingService:
             try:
                 video_config = VideoConfig.from_resolution_string(
                     resolution,
-                    fps=fps
+                    fps=fps,
+                    nice=nice,
+                    cpu_affinity=tuple(cpu_affinity) if cpu_affinity else None
                 )
                 ndi_config = NDIConfig(
                     stream_name=name,
@@ -396,6 +401,10 @@ class StreamingService:
         old_groups = current_config.ndi.groups
         old_raw_input = current_stream.get("raw_input", False)
         
+        # Scheduling isn't a restartable setting, keep it across the restart
+        nice = current_config.video.nice
+        cpu_affinity = current_config.video.cpu_affinity
+        
         # Merge with new settings (use current if not provided)
         new_name = name if name is not None else old_name
         new_resolution = resolution if resolution is not None else old_resolution
@@ -452,7 +461,9 @@ class StreamingService:
                 resolution=new_resolution,
                 fps=new_fps,
                 raw_input=new_raw_input,
-                groups=new_groups
+                groups=new_groups,
+                nice=nice,
+                cpu_affinity=cpu_affinity
             )
             
             restart_duration = time.time() - stop_start_time
@@ -487,7 +498,9 @@ class StreamingService:
                     resolution=old_resolution,
                     fps=old_fps,
                     raw_input=old_raw_input,
-                    groups=old_groups
+                    groups=old_groups,
+                    nice=nice,
+                    cpu_affinity=cpu_affinity
                 )
                 logger.info("Successfully rolled back to previous settings")
                 raise StreamingError(
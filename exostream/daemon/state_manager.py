@@ -45,6 +45,12 @@ class StateManager:
         self._state: Dict[str, Any] = {}
         self._lock = threading.Lock()
         
+        # Monotonic start times for uptime, so NTP steps after boot (a Pi has
+        # no RTC) don't skew it. The ISO timestamps in the state file stay
+        # for display and are only used as a fallback.
+        self._daemon_started_monotonic: Optional[float] = None
+        self._streams_started_monotonic: Dict[str, float] = {}
+        
         # Ensure state directory exists
         self.state_dir.mkdir(parents=True, exist_ok=True)
         
@@ -105,6 +111,7 @@ class StateManager:
         with self._lock:
             self._state["daemon"]["started_at"] = datetime.now().isoformat()
             self._state["daemon"]["pid"] = pid
+            self._daemon_started_monotonic = time.monotonic()
             self._save()
     
     def set_streaming_active(self, config: StreamConfig, ffmpeg_pid: int, raw_input: bool = False):
@@ -129,6 +136,7 @@ class StateManager:
                 "started_at": datetime.now().isoformat(),
                 "ffmpeg_pid": ffmpeg_pid
             }
+            self._streams_started_monotonic[device] = time.monotonic()
             
             # Update last known good config
             self._state["last_config"] = {
@@ -154,12 +162,14 @@ class StateManager:
                 if device in self._state["streams"]:
                     stream_name = self._state["streams"][device].get("stream_name", device)
                     del self._state["streams"][device]
+                    self._streams_started_monotonic.pop(device, None)
                     self._save()
                     logger.info(f"Stream marked as inactive: {stream_name} on {device}")
             else:
                 # Stop all streams
                 stream_count = len(self._state["streams"])
                 self._state["streams"] = {}
+                self._streams_started_monotonic.clear()
                 self._save()
                 logger.info(f"All streams marked as inactive ({stream_count} streams)")
     
@@ -228,6 +238,9 @@ class StateManager:
             Uptime in seconds, or None if not started
         """
         with self._lock:
+            if self._daemon_started_monotonic is not None:
+                return time.monotonic() - self._daemon_started_monotonic
+            
             started_at = self._state["daemon"].get("started_at")
             if not started_at:
                 return None
@@ -253,6 +266,10 @@ class StateManager:
             if device not in self._state["streams"]:
                 return None
             
+            started_monotonic = self._streams_started_monotonic.get(device)
+            if started_monotonic is not None:
+                return time.monotonic() - started_monotonic
+            
             started_at = self._state["streams"][device].get("started_at")
             if not started_at:
                 return None
@@ -293,6 +310,8 @@ class StateManager:
         """Reset to default state"""
         with self._lock:
             self._state = self._default_state()
+            self._daemon_started_monotonic = None
+            self._streams_started_monotonic.clear()
             self._save()
             logger.info("State cleared")
 
@@ -1,6 +1,12 @@
 """Remote control package for Exostream"""
 
-from .gui import ExostreamGUI, main
-
 __all__ = ['ExostreamGUI', 'main']
 
+
+def __getattr__(name):
+    # Import the GUI lazily so submodules like logparse can be used
+    # without tkinter installed
+    if name in __all__:
+        from . import gui
+        return getattr(gui, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,5 @@
+"""Run the remote control GUI with: python -m exostream.remote"""
+
+from .gui import main
+
+main()
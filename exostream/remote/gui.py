@@ -7,17 +7,16 @@ Built with tkinter for cross-platform compatibility.
 """
 
 import sys
-import os
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
 import queue
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from itertools import islice
 from typing import Optional, Dict, Any
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
-
 from exostream.cli.network_client import (
     NetworkClientManager,
     NetworkConnectionError,
@@ -25,6 +24,17 @@ from exostream.cli.network_client import (
     NetworkRPCError
 )
 from exostream.common.discovery import ExostreamServiceDiscovery
+from exostream.remote.logparse import parse_lines, layout_fragments
+
+# Device log filter choices
+LOG_LEVEL_FILTERS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+LOG_COMPONENT_FILTERS = {"TCP": "tcp", "FFMPEG": "ffmpeg"}
+
+# Device log lines kept in the Text widget; older ones are paged in on scroll
+DEVICE_LOG_RENDER_LINES = 1000
+DEVICE_LOG_PAGE_LINES = 500
+
+DEVICE_LOG_NOT_CONNECTED = "Connect to a daemon to view device logs."
 
 
 class ExostreamGUI:
@@ -41,17 +51,56 @@ class ExostreamGUI:
         self.host = tk.StringVar(value="localhost")
         self.port = tk.StringVar(value="9023")
         
+        # Reused worker threads for daemon calls (results go back via _post).
+        # A few workers so a slow stream start doesn't hold up refreshes.
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='exostream-gui')
+        
+        # Callbacks posted from non-Tk threads; the Tk thread is woken up to
+        # drain the queue only when something is posted (no idle polling)
+        self._ui_queue: queue.Queue = queue.Queue()
+        self._ui_wake_pending = False
+        self._ui_wake_lock = threading.Lock()
+        
+        # Newest pending arguments per callback for _post_latest
+        self._latest_posts: Dict[str, Any] = {}
+        self._latest_lock = threading.Lock()
+        
         # Service discovery
         self.discovery: Optional[ExostreamServiceDiscovery] = None
         self.discovered_services = {}
+        self._discovered_values = ()  # Last values pushed to the combo box
         
         # Status refresh
         self.auto_refresh = tk.BooleanVar(value=True)
-        self.refresh_interval = 2000  # ms
+        self._auto_refresh_on = True  # Mirrors auto_refresh so timers don't call into Tcl
+        self.auto_refresh.trace_add(
+            'write', lambda *_: setattr(self, '_auto_refresh_on', self.auto_refresh.get())
+        )
+        self.refresh_interval = 2000  # ms, backs off while nothing changes
+        self.base_refresh_interval = 2000  # ms
+        self.max_refresh_interval = 30000  # ms
+        self._last_dashboard_sig = None
         self.refresh_job = None
         
-        # Message queue for thread-safe UI updates
-        self.message_queue = queue.Queue()
+        # Last values pushed to widgets, to skip redundant Tk reconfigures
+        self._label_texts: Dict[str, str] = {}
+        self._label_styles: Dict[str, str] = {}
+        self._last_device_rows = None
+        self._last_devices_sig = None
+        self._last_resolutions_sig = None
+        self._last_fps_sig = None
+        
+        # Device log append cursor: (query, next_seq, next_line) or None for a full reload
+        self._device_log_cursor = None
+        
+        # All fetched device log lines; the widget only renders the newest ones
+        self._device_log_lines = deque()
+        self._device_log_page_job = None
+        
+        # Log tab: cached "%H:%M:%S" for the current second, entries awaiting insert
+        self._log_ts_cache = (0, '')
+        self._log_pending = []
+        self._log_flush_job = None
         
         # Build UI
         self._create_widgets()
@@ -60,8 +109,8 @@ class ExostreamGUI:
         # Setup cleanup on close
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
         
-        # Start message processing
-        self._process_messages()
+        # _post fires this to have the Tk thread drain its queue
+        self.root.bind('<<RPCDone>>', self._drain_ui_queue)
         
         # Auto-start discovery
         self._start_discovery()
@@ -103,6 +152,20 @@ class ExostreamGUI:
         self._create_device_log_tab()
         self._create_log_tab()
         
+        # Status labels updated by _update_status_display, keyed like _format_status()
+        self._status_widgets = {
+            'daemon_status': self.daemon_status,
+            'stream_status': self.stream_status,
+            'current_device': self.current_device,
+            'current_resolution': self.current_resolution,
+            'current_fps': self.current_fps,
+            'current_streaming': self.current_streaming
+        }
+        
+        # Auto-refresh is paused while hidden, catch up as soon as it's visible again
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add='+')
+        self.root.bind("<Map>", self._on_window_mapped, add='+')
+        
     def _create_connection_frame(self, parent):
         """Create connection controls"""
         frame = ttk.LabelFrame(parent, text="Connection", padding="10")
@@ -446,6 +509,11 @@ class ExostreamGUI:
         
         # Auto-refresh checkbox
         self.device_log_auto_refresh = tk.BooleanVar(value=False)
+        self._device_log_auto_refresh_on = False  # Mirrors device_log_auto_refresh
+        self.device_log_auto_refresh.trace_add(
+            'write',
+            lambda *_: setattr(self, '_device_log_auto_refresh_on', self.device_log_auto_refresh.get())
+        )
         ttk.Checkbutton(control_frame, text="Auto-refresh (1s)", 
                        variable=self.device_log_auto_refresh,
                        command=self._toggle_device_log_auto_refresh).pack(side=tk.LEFT)
@@ -454,6 +522,7 @@ class ExostreamGUI:
         self.device_log_text = scrolledtext.ScrolledText(frame, wrap=tk.WORD, height=25, 
                                                          font=('Courier', 9), bg='#1e1e1e', fg='#ffffff')
         self.device_log_text.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+        self.device_log_text.config(yscrollcommand=self._on_device_log_yscroll)
         
         # Clear log button
         ttk.Button(frame, text="Clear Log", command=self._clear_device_log).pack()
@@ -472,11 +541,18 @@ class ExostreamGUI:
         self.device_log_text.tag_config('port', foreground='#61afef')  # Light blue/cyan
         
         # Initial message
-        self.device_log_text.insert(tk.END, "Connect to a daemon to view device logs.\n")
         self.device_log_text.config(state=tk.DISABLED)
+        self._device_log_placeholder = None
+        self._show_device_log_placeholder(DEVICE_LOG_NOT_CONNECTED)
         
-        # Auto-refresh job
+        # Auto-refresh job (interval backs off while no new lines arrive)
         self.device_log_refresh_job = None
+        self.device_log_interval = 1000  # ms
+        self.base_device_log_interval = 1000  # ms
+        self.max_device_log_interval = 8000  # ms
+        
+        # Last parsed "lines" field value: (text, lines)
+        self._log_lines_cache = (None, None)
         
     def _create_log_tab(self):
         """Create log display tab"""
@@ -496,31 +572,59 @@ class ExostreamGUI:
         
     def _log(self, message: str, level: str = "INFO"):
         """Add message to log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {level}: {message}\n"
-        self.log_text.insert(tk.END, log_entry)
+        now = int(time.time())
+        if now != self._log_ts_cache[0]:
+            self._log_ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        log_entry = f"[{self._log_ts_cache[1]}] {level}: {message}\n"
+        
+        # Bursts of messages are inserted together once Tk is idle
+        self._log_pending.append(log_entry)
+        if self._log_flush_job is None:
+            self._log_flush_job = self.root.after_idle(self._flush_log)
+    
+    def _flush_log(self):
+        """Insert pending log entries"""
+        self._log_flush_job = None
+        if not self._log_pending:
+            return
+        entries = ''.join(self._log_pending)
+        self._log_pending.clear()
+        self.log_text.insert(tk.END, entries)
         self.log_text.see(tk.END)
         
     def _clear_log(self):
         """Clear the log"""
+        self._log_pending.clear()
         self.log_text.delete('1.0', tk.END)
         self._log("Log cleared")
     
     def _clear_device_log(self):
         """Clear the device log display"""
+        self._show_device_log_placeholder("Log cleared.")
+    
+    def _show_device_log_placeholder(self, message: str):
+        """Replace the device log with a single message line (no-op if already shown)"""
+        self._device_log_cursor = None
+        self._device_log_lines.clear()
+        if self._device_log_placeholder == message:
+            return
+        
         self.device_log_text.config(state=tk.NORMAL)
         self.device_log_text.delete('1.0', tk.END)
-        self.device_log_text.insert(tk.END, "Log cleared.\n")
+        self.device_log_text.insert(tk.END, f"{message}\n")
         self.device_log_text.config(state=tk.DISABLED)
+        self._device_log_placeholder = message
     
     def _on_closing(self):
         """Called when window is closing"""
-        # Stop discovery if running
+        # Stop discovery if running. Its listener thread posts to Tk, so it
+        # must not be joined from the Tk thread: stop it in the background.
         if self.discovery:
-            try:
-                self.discovery.stop()
-            except:
-                pass
+            self.discovery.callback = None
+            threading.Thread(
+                target=self.discovery.stop, daemon=True, name='exostream-gui-discovery-stop'
+            ).start()
+            self.discovery = None
         
         # Clean up bind_all handlers for macOS trackpad
         if sys.platform == 'darwin' and hasattr(self, '_settings_scroll_handlers'):
@@ -530,6 +634,15 @@ class ExostreamGUI:
             except:
                 pass
         
+        # Drop queued daemon calls and wake up the ones waiting on a reply,
+        # the (non-daemon) workers would otherwise keep the process alive
+        if self.client:
+            self.client.close()
+        if sys.version_info >= (3, 9):
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            self._executor.shutdown(wait=False)
+        
         # Close window
         self.root.destroy()
         
@@ -552,21 +665,23 @@ class ExostreamGUI:
             try:
                 self.client = NetworkClientManager(host, port)
                 if self.client.is_connected():
-                    self.message_queue.put(('connected', None))
+                    self._post(self._on_connected)
                 else:
-                    self.message_queue.put(('error', "Connection failed"))
+                    self._post(self._on_connect_error, "Connection failed")
             except Exception as e:
-                self.message_queue.put(('error', str(e)))
+                self._post(self._on_connect_error, str(e))
         
-        threading.Thread(target=connect_thread, daemon=True).start()
+        self._executor.submit(connect_thread)
         
     def _disconnect(self):
         """Disconnect from daemon"""
         self.connected = False
+        if self.client:
+            self.client.close()
         self.client = None
         
         # Update connection UI
-        self.conn_status_label.config(text="● Not Connected", style='Disconnected.TLabel')
+        self._set_label(self.conn_status_label, "● Not Connected", 'Disconnected.TLabel')
         self.connect_btn.config(state=tk.NORMAL)
         self.disconnect_btn.config(state=tk.DISABLED)
         
@@ -586,6 +701,10 @@ class ExostreamGUI:
         self.new_device.set('')
         self.new_name.delete(0, tk.END)
         
+        # Widgets were reset directly, forget cached values
+        self._reset_display_cache()
+        self._device_log_cursor = None
+        
         # Stop auto-refresh
         if self.refresh_job:
             self.root.after_cancel(self.refresh_job)
@@ -597,10 +716,7 @@ class ExostreamGUI:
             self.device_log_refresh_job = None
         
         # Clear device log display
-        self.device_log_text.config(state=tk.NORMAL)
-        self.device_log_text.delete('1.0', tk.END)
-        self.device_log_text.insert(tk.END, "Connect to a daemon to view device logs.\n")
-        self.device_log_text.config(state=tk.DISABLED)
+        self._show_device_log_placeholder(DEVICE_LOG_NOT_CONNECTED)
         
         self._log("Disconnected")
     
@@ -609,15 +725,14 @@ class ExostreamGUI:
         if self.discovery:
             return  # Already running
         
-        def discovery_thread():
-            try:
-                self.discovery = ExostreamServiceDiscovery(callback=self._on_service_discovered)
-                self.discovery.start()
-                self.message_queue.put(('discovery_started', None))
-            except Exception as e:
-                self.message_queue.put(('discovery_error', str(e)))
-        
-        threading.Thread(target=discovery_thread, daemon=True).start()
+        # start() only binds the UDP socket and spawns the listener threads,
+        # so it's fine to call it from the Tk thread
+        try:
+            self.discovery = ExostreamServiceDiscovery(callback=self._on_service_discovered)
+            self.discovery.start()
+            self._on_discovery_started()
+        except Exception as e:
+            self._on_discovery_error(str(e))
     
     def _refresh_discovery(self):
         """Force refresh of discovered cameras list"""
@@ -626,23 +741,29 @@ class ExostreamGUI:
             services = self.discovery.get_services()
             
             # Update discovered_services dict
-            self.discovered_services.clear()
-            for svc in services:
-                display_name = f"{svc['name']} ({svc['host']}:{svc['port']})"
-                self.discovered_services[display_name] = svc
+            self.discovered_services = {
+                f"{svc['name']} ({svc['host']}:{svc['port']})": svc
+                for svc in services
+            }
             
             # Update combo box
-            values = list(self.discovered_services.keys())
-            self.discovered_combo.config(values=values)
+            self._update_discovered_combo()
             
             self._log(f"Refreshed: Found {len(services)} camera(s)")
         else:
             # Restart discovery if not running
             self._start_discovery()
     
+    def _update_discovered_combo(self):
+        """Push discovered camera names to the combo box if the list changed"""
+        values = tuple(self.discovered_services)
+        if values != self._discovered_values:
+            self._discovered_values = values
+            self.discovered_combo.config(values=values)
+    
     def _on_service_discovered(self, event_type: str, data):
         """Called when a service is discovered/removed"""
-        self.message_queue.put(('service_event', {'event': event_type, 'data': data}))
+        self._post(self._handle_service_event, {'event': event_type, 'data': data})
     
     def _on_discovered_selected(self, event):
         """Called when user selects a discovered camera"""
@@ -657,28 +778,27 @@ class ExostreamGUI:
     def _on_connected(self):
         """Handle successful connection"""
         self.connected = True
-        self.conn_status_label.config(text="● Connected", style='Connected.TLabel')
+        self._set_label(self.conn_status_label, "● Connected", 'Connected.TLabel')
         self.connect_btn.config(state=tk.DISABLED)
         self.disconnect_btn.config(state=tk.NORMAL)
         
         self._log(f"Connected to {self.host.get()}:{self.port.get()}")
         
-        # Refresh status
-        self._refresh_status()
-        self._refresh_devices()
-        self._refresh_device_log()
+        # Refresh status, devices and device log in a single round-trip
+        self._reset_refresh_interval()
+        self._refresh_dashboard_background(include_logs=True)
         
         # Start auto-refresh if enabled
-        if self.auto_refresh.get():
+        if self._auto_refresh_on:
             self._schedule_refresh()
         
         # Start device log auto-refresh if enabled
-        if self.device_log_auto_refresh.get():
+        if self._device_log_auto_refresh_on:
             self._schedule_device_log_refresh()
         
     def _toggle_auto_refresh(self):
         """Toggle auto-refresh"""
-        if self.auto_refresh.get() and self.connected:
+        if self._auto_refresh_on and self.connected:
             self._schedule_refresh()
         elif self.refresh_job:
             self.root.after_cancel(self.refresh_job)
@@ -692,9 +812,56 @@ class ExostreamGUI:
         
     def _auto_refresh_status(self):
         """Auto-refresh status (called by timer)"""
-        if self.connected and self.auto_refresh.get():
-            self._refresh_status_background()
+        if self.connected and self._auto_refresh_on:
+            # Skip the RPC while minimized, but keep the timer running
+            if self._is_window_visible():
+                self._refresh_dashboard_background()
+            self._schedule_refresh()
+    
+    def _adapt_refresh_interval(self, changed: bool):
+        """Reset the status refresh interval on change, otherwise back off"""
+        if changed:
+            self.refresh_interval = self.base_refresh_interval
+        else:
+            self.refresh_interval = min(self.refresh_interval * 2, self.max_refresh_interval)
+    
+    def _reset_refresh_interval(self):
+        """Go back to fast polling (after a user action) and refresh soon"""
+        self.refresh_interval = self.base_refresh_interval
+        self.device_log_interval = self.base_device_log_interval
+        self._last_dashboard_sig = None
+        if self.refresh_job:
             self._schedule_refresh()
+    
+    def _adapt_device_log_interval(self, changed: bool):
+        """Reset the device log refresh interval on new lines, otherwise back off"""
+        if changed:
+            self.device_log_interval = self.base_device_log_interval
+        else:
+            self.device_log_interval = min(self.device_log_interval * 2, self.max_device_log_interval)
+    
+    def _is_window_visible(self) -> bool:
+        """Check if the main window is shown (not minimized or withdrawn)"""
+        return self.root.state() not in ('iconic', 'withdrawn')
+    
+    def _is_device_log_visible(self) -> bool:
+        """Check if the Device Log tab is the one being viewed"""
+        return (self._is_window_visible() and
+                self.notebook.tab(self.notebook.select(), "text") == "Device Log")
+    
+    def _on_window_mapped(self, event):
+        """Refresh immediately when the window is restored"""
+        if event.widget is not self.root or not self.connected:
+            return
+        if self._auto_refresh_on:
+            self._refresh_dashboard_background()
+        if self._device_log_auto_refresh_on and self._is_device_log_visible():
+            self._refresh_device_log()
+    
+    def _on_tab_changed(self, event):
+        """Refresh the device log immediately when its tab is selected"""
+        if self.connected and self._device_log_auto_refresh_on and self._is_device_log_visible():
+            self._refresh_device_log()
             
     def _refresh_status(self):
         """Refresh status (manual)"""
@@ -714,22 +881,76 @@ class ExostreamGUI:
                 # Get settings
                 settings = self.client.get_settings()
                 
-                self.message_queue.put(('status_update', {
+                data = {
                     'daemon': daemon_status,
                     'settings': settings
-                }))
+                }
+                data['status_view'] = self._format_status(data)
+                
+                self._post_latest(self._update_status_display, data)
                 
             except Exception as e:
-                self.message_queue.put(('status_error', str(e)))
+                self._post(self._on_status_error, str(e))
         
-        threading.Thread(target=refresh_thread, daemon=True).start()
+        self._executor.submit(refresh_thread)
         
-    def _update_status_display(self, data: Dict[str, Any]):
-        """Update status display with new data"""
+    def _refresh_dashboard_background(self, include_logs: bool = False):
+        """Refresh status, devices (and optionally device log) with one batched call"""
+        def refresh_thread():
+            try:
+                if include_logs:
+                    query = self._get_device_log_query()
+                    level, component_filter, lines = query
+                    dashboard = self.client.get_dashboard(
+                        include_logs=True, level=level, lines=lines, component=component_filter
+                    )
+                    if 'log' in dashboard:
+                        self._prepare_device_log(dashboard['log'], query, None)
+                else:
+                    dashboard = self.client.get_dashboard()
+                dashboard['status_view'] = self._format_status(dashboard)
+                
+                if include_logs:
+                    self._post(self._update_dashboard_display, dashboard)
+                else:
+                    self._post_latest(self._update_dashboard_display, dashboard)
+                
+            except Exception as e:
+                self._post(self._on_status_error, str(e))
+        
+        self._executor.submit(refresh_thread)
+        
+    def _set_label(self, label, text: str, style: Optional[str] = None):
+        """Configure label text/style only where it differs from the last value set"""
+        key = str(label)
+        options = {}
+        if self._label_texts.get(key) != text:
+            self._label_texts[key] = text
+            options['text'] = text
+        # ttk re-resolves the style on every apply, so only set it when it flips
+        if style is not None and self._label_styles.get(key) != style:
+            self._label_styles[key] = style
+            options['style'] = style
+        if options:
+            label.config(**options)
+    
+    def _reset_display_cache(self):
+        """Forget cached widget values so the next refresh repaints everything"""
+        # Styles are only ever applied through _set_label, so they stay valid
+        self._label_texts.clear()
+        self._last_device_rows = None
+        self._last_devices_sig = None
+        self._last_resolutions_sig = None
+        self._last_fps_sig = None
+        
+    @staticmethod
+    def _format_status(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build status label texts/styles from status data (safe to call from worker threads)"""
         daemon = data.get('daemon', {})
         settings = data.get('settings', {})
+        view = {}
         
-        # Update daemon status
+        # Daemon status
         if daemon.get('running'):
             uptime = daemon.get('uptime_seconds', 0)
             if uptime < 60:
@@ -738,50 +959,63 @@ class ExostreamGUI:
                 uptime_str = f"{uptime/60:.0f}m"
             else:
                 uptime_str = f"{uptime/3600:.1f}h"
-            self.daemon_status.config(text=f"Running (uptime: {uptime_str})")
+            view['daemon_status'] = (f"Running (uptime: {uptime_str})", None)
         else:
-            self.daemon_status.config(text="Not running")
+            view['daemon_status'] = ("Not running", None)
         
-        # Update stream status
+        # Stream status
         if settings.get('streaming'):
-            self.stream_status.config(text="● Streaming", style='Streaming.TLabel')
+            view['stream_status'] = ("● Streaming", 'Streaming.TLabel')
         else:
-            self.stream_status.config(text="● Not streaming", style='NotStreaming.TLabel')
+            view['stream_status'] = ("● Not streaming", 'NotStreaming.TLabel')
         
-        # Update current settings display
-        self.current_device.config(text=settings.get('device', 'Unknown'))
-        self.current_resolution.config(text=settings.get('resolution', 'Unknown'))
-        self.current_fps.config(text=str(settings.get('fps', 'Unknown')))
+        # Current settings display
+        view['current_device'] = (settings.get('device', 'Unknown'), None)
+        view['current_resolution'] = (settings.get('resolution', 'Unknown'), None)
+        view['current_fps'] = (str(settings.get('fps', 'Unknown')), None)
         
         if settings.get('streaming'):
             stream_name = settings.get('name', 'Unknown')
-            self.current_streaming.config(text=f"Yes - {stream_name}")
+            view['current_streaming'] = (f"Yes - {stream_name}", None)
         else:
-            self.current_streaming.config(text="No")
+            view['current_streaming'] = ("No", None)
+        
+        return view
+    
+    def _update_status_display(self, data: Dict[str, Any]):
+        """Update status display with new data"""
+        view = data.get('status_view')
+        if view is None:
+            view = self._format_status(data)
+        
+        for name, (text, style) in view.items():
+            self._set_label(self._status_widgets[name], text, style)
         
         # Pre-fill update settings fields with current values
-        self._populate_settings_fields(settings)
+        self._populate_settings_fields(data.get('settings', {}))
     
     def _populate_settings_fields(self, settings: Dict[str, Any]):
         """Populate the update settings input fields with current values"""
+        # Only touch widgets whose value actually differs
+        
         # Set resolution
         resolution = settings.get('resolution', '')
-        if resolution:
+        if resolution and self.new_resolution.get() != resolution:
             self.new_resolution.set(resolution)
         
         # Set FPS
         fps = settings.get('fps')
-        if fps is not None:
+        if fps is not None and self.new_fps.get() != str(fps):
             self.new_fps.set(str(fps))
         
         # Set device
         device = settings.get('device', '')
-        if device:
+        if device and self.new_device.get() != device:
             self.new_device.set(device)
         
         # Set stream name
         name = settings.get('name', '')
-        if name:
+        if name and self.new_name.get() != name:
             self.new_name.delete(0, tk.END)
             self.new_name.insert(0, name)
         
@@ -794,112 +1028,134 @@ class ExostreamGUI:
             try:
                 devices = self.client.list_devices()
                 available_options = self.client.get_available_options()
-                self.message_queue.put(('devices_update', {
+                self._post_latest(self._update_devices_display, {
                     'devices': devices,
                     'options': available_options
-                }))
+                })
             except Exception as e:
-                self.message_queue.put(('devices_error', str(e)))
+                self._post(self._on_devices_error, str(e))
         
-        threading.Thread(target=refresh_thread, daemon=True).start()
+        self._executor.submit(refresh_thread)
         
     def _update_devices_display(self, data: Dict[str, Any]):
         """Update devices display"""
         devices = data.get('devices', [])
         options = data.get('options', {})
         
-        # Clear existing items
-        for item in self.devices_tree.get_children():
-            self.devices_tree.delete(item)
-        
-        # Add devices
-        for device in devices:
-            status = "IN USE" if device.get('in_use') else "FREE"
-            self.devices_tree.insert('', tk.END, values=(
-                status,
+        # Rebuild the tree only if any row changed
+        rows = tuple(
+            (
+                "IN USE" if device.get('in_use') else "FREE",
                 device.get('path', ''),
                 device.get('name', '')
-            ))
+            )
+            for device in devices
+        )
+        if rows != self._last_device_rows:
+            self._last_device_rows = rows
+            
+            # Clear existing items
+            for item in self.devices_tree.get_children():
+                self.devices_tree.delete(item)
+            
+            # Add devices
+            for row in rows:
+                self.devices_tree.insert('', tk.END, values=row)
         
         # Update device combobox
-        device_paths = [d.get('path') for d in devices]
-        self.new_device.config(values=device_paths)
+        devices_sig = tuple(d.get('path') for d in devices)
+        if devices_sig != self._last_devices_sig:
+            self._last_devices_sig = devices_sig
+            self.new_device.config(values=list(devices_sig))
         
         # Update resolution combobox
-        resolutions = options.get('resolutions', [])
-        if resolutions:
-            self.new_resolution.config(values=resolutions)
+        resolutions = tuple(options.get('resolutions', []))
+        if resolutions and resolutions != self._last_resolutions_sig:
+            self._last_resolutions_sig = resolutions
+            self.new_resolution.config(values=list(resolutions))
         
         # Update FPS combobox
-        fps_options = options.get('fps_options', [])
-        if fps_options:
-            self.new_fps.config(values=[str(f) for f in fps_options])
+        fps_options = tuple(str(f) for f in options.get('fps_options', []))
+        if fps_options and fps_options != self._last_fps_sig:
+            self._last_fps_sig = fps_options
+            self.new_fps.config(values=list(fps_options))
     
     def _refresh_device_log(self):
         """Refresh device log display"""
         if not self.connected:
-            self.device_log_text.config(state=tk.NORMAL)
-            self.device_log_text.delete('1.0', tk.END)
-            self.device_log_text.insert(tk.END, "Connect to a daemon to view device logs.\n")
-            self.device_log_text.config(state=tk.DISABLED)
+            self._show_device_log_placeholder(DEVICE_LOG_NOT_CONNECTED)
             return
         
         def refresh_thread():
             try:
-                # Get filter settings
-                filter_value = self.log_filter.get()
-                
-                # Determine if it's a level filter or component filter
-                level = None
-                component_filter = None
+                query = self._get_device_log_query()
+                level, component_filter, lines = query
                 
-                if filter_value in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-                    level = filter_value
-                elif filter_value == "ALL":
-                    level = None
-                elif filter_value == "TCP":
-                    component_filter = "tcp"
-                elif filter_value == "FFMPEG":
-                    component_filter = "ffmpeg"
-                
-                lines_str = self.log_lines_var.get()
-                try:
-                    lines = int(lines_str) if lines_str else None
-                except ValueError:
-                    lines = 500  # Default
+                # Only fetch new lines if the filter hasn't changed since the last update
+                cursor = self._device_log_cursor
+                if cursor is not None and cursor[0] != query:
+                    cursor = None
+                since_seq = cursor[1] if cursor else None
                 
                 # Get logs from daemon
-                result = self.client.get_logs(level=level, lines=lines)
-                
-                # Apply component filtering if needed (client-side)
-                if component_filter:
-                    logs = result.get('logs', [])
-                    filtered_logs = []
-                    for log_line in logs:
-                        # Check if log line contains the component name
-                        # Format: YYYY-MM-DD HH:MM:SS - logger_name - LEVEL - message
-                        # Look for component in logger name (between first and second dash)
-                        if component_filter == "tcp":
-                            # Look for tcp_server in logger name
-                            if "tcp_server" in log_line.lower() or "tcp" in log_line.lower():
-                                filtered_logs.append(log_line)
-                        elif component_filter == "ffmpeg":
-                            # Look for ffmpeg in logger name
-                            if "ffmpeg" in log_line.lower():
-                                filtered_logs.append(log_line)
-                    result['logs'] = filtered_logs
-                    result['total_lines'] = len(filtered_logs)
-                    result['filtered_by'] = component_filter.upper()
+                result = self.client.get_logs(
+                    level=level, lines=lines, since_seq=since_seq, component=component_filter
+                )
+                self._prepare_device_log(result, query, cursor)
                 
-                self.message_queue.put(('device_log_update', result))
+                self._post(self._update_device_log_display, result)
             except Exception as e:
-                self.message_queue.put(('device_log_error', str(e)))
+                self._post(self._on_device_log_error, str(e))
         
-        threading.Thread(target=refresh_thread, daemon=True).start()
+        self._executor.submit(refresh_thread)
+    
+    def _get_device_log_query(self):
+        """Get (level, component_filter, lines) for the current device log filter settings"""
+        filter_value = self.log_filter.get()
+        
+        # Determine if it's a level filter or component filter ("ALL" is neither)
+        level = filter_value if filter_value in LOG_LEVEL_FILTERS else None
+        component_filter = LOG_COMPONENT_FILTERS.get(filter_value)
+        
+        # Only re-parse the line count when the field changed
+        lines_str = self.log_lines_var.get()
+        if lines_str != self._log_lines_cache[0]:
+            try:
+                lines = int(lines_str) if lines_str else None
+            except ValueError:
+                lines = 500  # Default
+            self._log_lines_cache = (lines_str, lines)
+        lines = self._log_lines_cache[1]
+        
+        return level, component_filter, lines
+    
+    def _prepare_device_log(self, result: Dict[str, Any], query, cursor):
+        """Filter and parse a logs.get result in place (runs in worker threads)"""
+        # The daemon already filtered by component, just label it
+        component_filter = query[1]
+        if component_filter:
+            result['filtered_by'] = component_filter.upper()
+        
+        # New lines are appended after the ones already shown, unless the
+        # daemon read the log from the start
+        if result.get('since_seq') is None:
+            cursor = None
+        first_line = cursor[2] if cursor else 1
+        
+        # Build the colorized text and tag ranges off the Tk thread. A full
+        # reload only renders the newest lines, older ones are paged in on scroll.
+        logs = result.get('logs', [])
+        if cursor is None:
+            logs = logs[-DEVICE_LOG_RENDER_LINES:]
+        result['text'], result['tag_ranges'] = layout_fragments(
+            parse_lines(logs), first_line
+        )
+        result['query'] = query
+        result['cursor'] = cursor
     
     def _toggle_device_log_auto_refresh(self):
         """Toggle auto-refresh for device log"""
-        if self.device_log_auto_refresh.get() and self.connected:
+        if self._device_log_auto_refresh_on and self.connected:
             self._schedule_device_log_refresh()
         elif self.device_log_refresh_job:
             self.root.after_cancel(self.device_log_refresh_job)
@@ -907,143 +1163,18 @@ class ExostreamGUI:
     
     def _schedule_device_log_refresh(self):
         """Schedule next device log refresh"""
-        if self.device_log_auto_refresh.get() and self.connected:
-            self._refresh_device_log()
-            self.device_log_refresh_job = self.root.after(1000, self._schedule_device_log_refresh)  # 1 second
-    
-    def _insert_colored_log_line(self, log_line: str):
-        """Insert a log line with colorization matching rich console output"""
-        import re
-        
-        # Pattern: YYYY-MM-DD HH:MM:SS - logger_name - LEVEL - message
-        # Or: [HH:MM:SS] INFO Client connected from ('IP', PORT)
-        pattern1 = r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - ([^-]+) - (DEBUG|INFO|WARNING|ERROR|CRITICAL) - (.+)$'
-        pattern2 = r'^\[(\d{2}:\d{2}:\d{2})\] (DEBUG|INFO|WARNING|ERROR|CRITICAL) (.+)$'
-        
-        match1 = re.match(pattern1, log_line)
-        match2 = re.match(pattern2, log_line)
-        
-        if match1:
-            # Format: YYYY-MM-DD HH:MM:SS - logger_name - LEVEL - message
-            timestamp, logger_name, level, message = match1.groups()
-            
-            # Insert timestamp
-            start = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.insert(tk.END, timestamp)
-            end = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.tag_add('timestamp', start, end)
-            
-            # Insert separator
-            self.device_log_text.insert(tk.END, ' - ')
-            start = self.device_log_text.index(tk.END + '-3c')
-            end = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.tag_add('separator', start, end)
-            
-            # Insert logger name
-            start = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.insert(tk.END, logger_name.strip())
-            end = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.tag_add('logger', start, end)
-            
-            # Insert separator
-            self.device_log_text.insert(tk.END, ' - ')
-            start = self.device_log_text.index(tk.END + '-3c')
-            end = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.tag_add('separator', start, end)
-            
-            # Insert level with color
-            level_tag = f'level_{level.lower()}'
-            start = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.insert(tk.END, level)
-            end = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.tag_add(level_tag, start, end)
-            
-            # Insert separator
-            self.device_log_text.insert(tk.END, ' - ')
-            start = self.device_log_text.index(tk.END + '-3c')
-            end = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.tag_add('separator', start, end)
-            
-            # Insert message (with special handling for IP addresses and ports)
-            self._insert_colored_message(message)
-            
-        elif match2:
-            # Format: [HH:MM:SS] LEVEL message
-            timestamp, level, message = match2.groups()
-            
-            # Insert timestamp
-            start = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.insert(tk.END, f'[{timestamp}]')
-            end = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.tag_add('timestamp', start, end)
-            
-            # Insert space and level
-            self.device_log_text.insert(tk.END, ' ')
-            level_tag = f'level_{level.lower()}'
-            start = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.insert(tk.END, level)
-            end = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.tag_add(level_tag, start, end)
-            
-            # Insert space and message
-            self.device_log_text.insert(tk.END, ' ')
-            self._insert_colored_message(message)
-        else:
-            # Plain text line
-            self.device_log_text.insert(tk.END, log_line)
-        
-        self.device_log_text.insert(tk.END, '\n')
-    
-    def _insert_colored_message(self, message: str):
-        """Insert message with colorization for IP addresses and ports"""
-        import re
-        
-        # Pattern for: Client connected from ('IP', PORT) or ('IP',PORT)
-        ip_port_pattern = r"\(['\"]?(\d+\.\d+\.\d+\.\d+)['\"]?,\s*(\d+)\)"
-        
-        last_pos = 0
-        for match in re.finditer(ip_port_pattern, message):
-            # Insert text before match
-            if match.start() > last_pos:
-                start = self.device_log_text.index(tk.END + '-1c')
-                self.device_log_text.insert(tk.END, message[last_pos:match.start()])
-                end = self.device_log_text.index(tk.END + '-1c')
-                self.device_log_text.tag_add('message', start, end)
-            
-            # Insert opening parenthesis
-            self.device_log_text.insert(tk.END, '(')
-            
-            # Insert IP address
-            ip_addr = match.group(1)
-            start = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.insert(tk.END, ip_addr)
-            end = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.tag_add('ip_address', start, end)
-            
-            # Insert comma and space
-            self.device_log_text.insert(tk.END, ', ')
-            
-            # Insert port number
-            port = match.group(2)
-            start = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.insert(tk.END, port)
-            end = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.tag_add('port', start, end)
-            
-            # Insert closing parenthesis
-            self.device_log_text.insert(tk.END, ')')
-            
-            last_pos = match.end()
-        
-        # Insert remaining text
-        if last_pos < len(message):
-            start = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.insert(tk.END, message[last_pos:])
-            end = self.device_log_text.index(tk.END + '-1c')
-            self.device_log_text.tag_add('message', start, end)
+        if self._device_log_auto_refresh_on and self.connected:
+            # Only fetch while the tab is actually being viewed
+            if self._is_device_log_visible():
+                self._refresh_device_log()
+            self.device_log_refresh_job = self.root.after(self.device_log_interval, self._schedule_device_log_refresh)
     
     def _update_device_log_display(self, data: Dict[str, Any]):
         """Update device log display with new logs"""
+        if data.get('cursor') is not None:
+            self._append_device_log(data)
+            return
+        
         logs = data.get('logs', [])
         total_lines = data.get('total_lines', 0)
         filtered_by = data.get('filtered_by')
@@ -1051,25 +1182,125 @@ class ExostreamGUI:
         # Enable text widget for editing
         self.device_log_text.config(state=tk.NORMAL)
         self.device_log_text.delete('1.0', tk.END)
+        self._device_log_placeholder = None
         
         if not logs:
             self.device_log_text.insert(tk.END, "No logs available.\n")
             if filtered_by:
                 self.device_log_text.insert(tk.END, f"Filtered by: {filtered_by}\n")
         else:
-            # Display logs with colorization
-            for log_line in logs:
-                self._insert_colored_log_line(log_line)
+            # Display logs with colorization: one insert, one tag_add per tag
+            text = data.get('text')
+            if text is None:
+                text, tag_ranges = layout_fragments(parse_lines(logs[-DEVICE_LOG_RENDER_LINES:]))
+            else:
+                tag_ranges = data.get('tag_ranges', {})
+            self._insert_device_log_text('1.0', text, tag_ranges)
             
             # Add summary (plain text)
-            self.device_log_text.insert(tk.END, f"\n--- Total: {total_lines} lines")
-            if filtered_by:
-                self.device_log_text.insert(tk.END, f" (filtered by {filtered_by})")
-            self.device_log_text.insert(tk.END, " ---\n")
+            self._insert_device_log_footer(total_lines, filtered_by)
+        
+        self._adapt_device_log_interval(changed=True)
+        
+        # Remember where to append the next incremental update
+        max_lines = data['query'][2] if 'query' in data else None
+        self._device_log_lines = deque(logs, maxlen=max_lines or None)
+        if logs and data.get('next_seq') is not None and 'query' in data:
+            rendered = min(len(logs), DEVICE_LOG_RENDER_LINES)
+            self._device_log_cursor = (data['query'], data['next_seq'], rendered + 1)
+        else:
+            self._device_log_cursor = None
         
         # Scroll to bottom
         self.device_log_text.see(tk.END)
         self.device_log_text.config(state=tk.DISABLED)
+    
+    def _append_device_log(self, data: Dict[str, Any]):
+        """Append new device log lines, trimming the oldest beyond the line limit"""
+        cursor = data['cursor']
+        if cursor is not self._device_log_cursor:
+            return  # Superseded by a newer update
+        
+        query, _, next_line = cursor
+        logs = data.get('logs', [])
+        if not logs:
+            # Nothing new to show, just move the cursor past any filtered lines
+            self._device_log_cursor = (query, data['next_seq'], next_line)
+            self._adapt_device_log_interval(changed=False)
+            return
+        
+        self._adapt_device_log_interval(changed=True)
+        
+        self.device_log_text.config(state=tk.NORMAL)
+        
+        # Replace the footer with the new lines
+        self.device_log_text.delete(f'{next_line}.0', tk.END)
+        self._insert_device_log_text(f'{next_line}.0', data['text'], data['tag_ranges'])
+        next_line += len(logs)
+        
+        # The deque drops lines beyond the requested number of lines, the
+        # widget also drops lines beyond what it renders
+        self._device_log_lines.extend(logs)
+        shown = next_line - 1
+        keep = min(len(self._device_log_lines), DEVICE_LOG_RENDER_LINES)
+        if shown > keep:
+            excess = shown - keep
+            self.device_log_text.delete('1.0', f'{excess + 1}.0')
+            next_line -= excess
+        
+        self._insert_device_log_footer(len(self._device_log_lines), data.get('filtered_by'))
+        self._device_log_cursor = (query, data['next_seq'], next_line)
+        
+        self.device_log_text.see(tk.END)
+        self.device_log_text.config(state=tk.DISABLED)
+    
+    def _on_device_log_yscroll(self, first, last):
+        """Update the scrollbar, paging in older lines when scrolled to the top"""
+        self.device_log_text.vbar.set(first, last)
+        
+        cursor = self._device_log_cursor
+        if float(first) > 0.0 or cursor is None or self._device_log_page_job is not None:
+            return
+        if len(self._device_log_lines) > cursor[2] - 1:
+            self._device_log_page_job = self.root.after_idle(self._page_in_device_log)
+    
+    def _page_in_device_log(self):
+        """Render the next page of older device log lines above the current ones"""
+        self._device_log_page_job = None
+        cursor = self._device_log_cursor
+        if cursor is None:
+            return
+        
+        query, next_seq, next_line = cursor
+        hidden = len(self._device_log_lines) - (next_line - 1)
+        count = min(hidden, DEVICE_LOG_PAGE_LINES)
+        if count <= 0:
+            return
+        
+        lines = list(islice(self._device_log_lines, hidden - count, hidden))
+        text, tag_ranges = layout_fragments(parse_lines(lines))
+        
+        self.device_log_text.config(state=tk.NORMAL)
+        self._insert_device_log_text('1.0', text, tag_ranges)
+        self.device_log_text.config(state=tk.DISABLED)
+        
+        # Keep the previously first line at the top of the view
+        self.device_log_text.yview(f'{count + 1}.0')
+        self._device_log_cursor = (query, next_seq, next_line + count)
+    
+    def _insert_device_log_text(self, index: str, text: str, tag_ranges: Dict[str, Any]):
+        """Insert colorized text built by layout_fragments() at index"""
+        self.device_log_text.insert(index, text)
+        tag_add = self.device_log_text.tag_add
+        for tag, ranges in tag_ranges.items():
+            tag_add(tag, *ranges)
+    
+    def _insert_device_log_footer(self, total_lines: int, filtered_by: Optional[str]):
+        """Insert the device log summary line"""
+        self.device_log_text.insert(tk.END, f"\n--- Total: {total_lines} lines")
+        if filtered_by:
+            self.device_log_text.insert(tk.END, f" (filtered by {filtered_by})")
+        self.device_log_text.insert(tk.END, " ---\n")
         
     def _update_settings(self):
         """Update camera settings"""
@@ -1105,16 +1336,17 @@ class ExostreamGUI:
         params['restart_if_streaming'] = self.auto_restart.get()
         
         self._log(f"Updating settings: {params}")
+        self._reset_refresh_interval()
         
         # Update in background
         def update_thread():
             try:
                 result = self.client.update_settings(**params)
-                self.message_queue.put(('settings_updated', result))
+                self._post(self._on_settings_updated, result)
             except Exception as e:
-                self.message_queue.put(('update_error', str(e)))
+                self._post(self._on_update_error, str(e))
         
-        threading.Thread(target=update_thread, daemon=True).start()
+        self._executor.submit(update_thread)
         
     def _start_stream(self):
         """Start streaming"""
@@ -1135,6 +1367,7 @@ class ExostreamGUI:
             return
         
         self._log(f"Starting stream: {name} ({resolution} @ {fps}fps)")
+        self._reset_refresh_interval()
         
         def start_thread():
             try:
@@ -1144,11 +1377,11 @@ class ExostreamGUI:
                     resolution=resolution,
                     fps=fps
                 )
-                self.message_queue.put(('stream_started', result))
+                self._post(self._on_stream_started, result)
             except Exception as e:
-                self.message_queue.put(('start_error', str(e)))
+                self._post(self._on_start_error, str(e))
         
-        threading.Thread(target=start_thread, daemon=True).start()
+        self._executor.submit(start_thread)
         
     def _stop_stream(self):
         """Stop streaming"""
@@ -1158,78 +1391,147 @@ class ExostreamGUI:
         
         if messagebox.askyesno("Confirm", "Stop the current stream?"):
             self._log("Stopping stream...")
+            self._reset_refresh_interval()
             
             def stop_thread():
                 try:
                     result = self.client.stop_stream()
-                    self.message_queue.put(('stream_stopped', result))
+                    self._post(self._on_stream_stopped, result)
                 except Exception as e:
-                    self.message_queue.put(('stop_error', str(e)))
+                    self._post(self._on_stop_error, str(e))
             
-            threading.Thread(target=stop_thread, daemon=True).start()
+            self._executor.submit(stop_thread)
+        
+    def _post(self, callback, *args):
+        """Run callback on the Tk thread (safe to call from worker threads)"""
+        self._ui_queue.put((callback, args))
+        
+        # One wake-up per batch: skip it while a drain is already pending
+        with self._ui_wake_lock:
+            if self._ui_wake_pending:
+                return
+            self._ui_wake_pending = True
         
-    def _process_messages(self):
-        """Process messages from background threads"""
+        # Tk calls from a worker thread are marshalled to the Tk thread by
+        # threaded Tcl builds (the default for CPython). 'tail' queues the
+        # event behind pending ones instead of handling it right away.
         try:
-            while True:
-                msg_type, msg_data = self.message_queue.get_nowait()
-                
-                if msg_type == 'connected':
-                    self._on_connected()
-                elif msg_type == 'error':
-                    self.connect_btn.config(state=tk.NORMAL)
-                    messagebox.showerror("Connection Error", f"Failed to connect: {msg_data}")
-                    self._log(f"Connection failed: {msg_data}", "ERROR")
-                elif msg_type == 'status_update':
-                    self._update_status_display(msg_data)
-                elif msg_type == 'status_error':
-                    self._log(f"Status error: {msg_data}", "ERROR")
-                elif msg_type == 'devices_update':
-                    self._update_devices_display(msg_data)
-                elif msg_type == 'devices_error':
-                    self._log(f"Devices error: {msg_data}", "ERROR")
-                elif msg_type == 'settings_updated':
-                    self._log("Settings updated successfully")
-                    messagebox.showinfo("Success", "Settings updated successfully")
-                    self._refresh_status()
-                elif msg_type == 'update_error':
-                    self._log(f"Update error: {msg_data}", "ERROR")
-                    messagebox.showerror("Error", f"Failed to update settings: {msg_data}")
-                elif msg_type == 'stream_started':
-                    self._log("Stream started successfully")
-                    messagebox.showinfo("Success", "Stream started")
-                    self._refresh_status()
-                elif msg_type == 'start_error':
-                    self._log(f"Start error: {msg_data}", "ERROR")
-                    messagebox.showerror("Error", f"Failed to start stream: {msg_data}")
-                elif msg_type == 'stream_stopped':
-                    self._log("Stream stopped successfully")
-                    messagebox.showinfo("Success", "Stream stopped")
-                    self._refresh_status()
-                elif msg_type == 'stop_error':
-                    self._log(f"Stop error: {msg_data}", "ERROR")
-                    messagebox.showerror("Error", f"Failed to stop stream: {msg_data}")
-                elif msg_type == 'discovery_started':
-                    self._log("Discovery started - continuously scanning for cameras")
-                elif msg_type == 'discovery_error':
-                    self._log(f"Discovery error: {msg_data}", "ERROR")
-                    messagebox.showerror("Discovery Error", f"Failed to start discovery: {msg_data}")
-                elif msg_type == 'device_log_update':
-                    self._update_device_log_display(msg_data)
-                elif msg_type == 'device_log_error':
-                    self._log(f"Error fetching device logs: {msg_data}", "ERROR")
-                    self.device_log_text.config(state=tk.NORMAL)
-                    self.device_log_text.insert(tk.END, f"\n[ERROR] Failed to fetch logs: {msg_data}\n")
-                    self.device_log_text.see(tk.END)
-                    self.device_log_text.config(state=tk.DISABLED)
-                elif msg_type == 'service_event':
-                    self._handle_service_event(msg_data)
-                    
-        except queue.Empty:
-            pass
-        
-        # Schedule next check
-        self.root.after(100, self._process_messages)
+            self.root.event_generate('<<RPCDone>>', when='tail')
+        except (RuntimeError, tk.TclError):
+            pass  # Main loop has already exited or the window is destroyed
+    
+    def _drain_ui_queue(self, event=None):
+        """Run callbacks posted through _post (Tk thread, on <<RPCDone>>)"""
+        with self._ui_wake_lock:
+            self._ui_wake_pending = False
+        
+        while True:
+            try:
+                callback, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                callback(*args)
+            except Exception:
+                # Report like any Tk callback, without dropping the rest
+                self.root.report_callback_exception(*sys.exc_info())
+    
+    def _post_latest(self, callback, *args):
+        """Like _post, but if a call is still pending only the newest args are delivered"""
+        key = callback.__name__
+        with self._latest_lock:
+            pending = key in self._latest_posts
+            self._latest_posts[key] = args
+        if not pending:
+            self._post(self._deliver_latest, key, callback)
+    
+    def _deliver_latest(self, key: str, callback):
+        """Run callback with the newest args posted through _post_latest"""
+        with self._latest_lock:
+            args = self._latest_posts.pop(key)
+        callback(*args)
+    
+    def _on_connect_error(self, error: str):
+        """Handle failed connection"""
+        self.connect_btn.config(state=tk.NORMAL)
+        messagebox.showerror("Connection Error", f"Failed to connect: {error}")
+        self._log(f"Connection failed: {error}", "ERROR")
+    
+    def _update_dashboard_display(self, data: Dict[str, Any]):
+        """Update status, devices and (if present) device log from a dashboard result"""
+        # Uptime is left out, it always changes
+        sig = (
+            data.get('daemon', {}).get('running'),
+            data.get('settings'),
+            data.get('devices')
+        )
+        self._adapt_refresh_interval(sig != self._last_dashboard_sig)
+        self._last_dashboard_sig = sig
+        
+        self._update_status_display(data)
+        self._update_devices_display(data)
+        if 'log' in data:
+            self._update_device_log_display(data['log'])
+    
+    def _on_status_error(self, error: str):
+        """Handle status refresh error"""
+        self._log(f"Status error: {error}", "ERROR")
+        self._adapt_refresh_interval(changed=False)
+    
+    def _on_devices_error(self, error: str):
+        """Handle devices refresh error"""
+        self._log(f"Devices error: {error}", "ERROR")
+    
+    def _on_settings_updated(self, result: Dict[str, Any]):
+        """Handle successful settings update"""
+        self._log("Settings updated successfully")
+        messagebox.showinfo("Success", "Settings updated successfully")
+        self._refresh_status()
+    
+    def _on_update_error(self, error: str):
+        """Handle settings update error"""
+        self._log(f"Update error: {error}", "ERROR")
+        messagebox.showerror("Error", f"Failed to update settings: {error}")
+    
+    def _on_stream_started(self, result: Dict[str, Any]):
+        """Handle successful stream start"""
+        self._log("Stream started successfully")
+        messagebox.showinfo("Success", "Stream started")
+        self._refresh_status()
+    
+    def _on_start_error(self, error: str):
+        """Handle stream start error"""
+        self._log(f"Start error: {error}", "ERROR")
+        messagebox.showerror("Error", f"Failed to start stream: {error}")
+    
+    def _on_stream_stopped(self, result: Dict[str, Any]):
+        """Handle successful stream stop"""
+        self._log("Stream stopped successfully")
+        messagebox.showinfo("Success", "Stream stopped")
+        self._refresh_status()
+    
+    def _on_stop_error(self, error: str):
+        """Handle stream stop error"""
+        self._log(f"Stop error: {error}", "ERROR")
+        messagebox.showerror("Error", f"Failed to stop stream: {error}")
+    
+    def _on_discovery_started(self):
+        """Handle discovery startup"""
+        self._log("Discovery started - continuously scanning for cameras")
+    
+    def _on_discovery_error(self, error: str):
+        """Handle discovery startup error"""
+        self._log(f"Discovery error: {error}", "ERROR")
+        messagebox.showerror("Discovery Error", f"Failed to start discovery: {error}")
+    
+    def _on_device_log_error(self, error: str):
+        """Handle device log fetch error"""
+        self._log(f"Error fetching device logs: {error}", "ERROR")
+        self._adapt_device_log_interval(changed=False)
+        self.device_log_text.config(state=tk.NORMAL)
+        self.device_log_text.insert(tk.END, f"\n[ERROR] Failed to fetch logs: {error}\n")
+        self.device_log_text.see(tk.END)
+        self.device_log_text.config(state=tk.DISABLED)
     
     def _handle_service_event(self, data: Dict):
         """Handle service discovery events"""
@@ -1246,6 +1548,7 @@ class ExostreamGUI:
                 version = service_data.version
                 
                 display_name = f"{name} ({host}:{port})"
+                is_new = display_name not in self.discovered_services
                 
                 self.discovered_services[display_name] = {
                     'name': name,
@@ -1255,9 +1558,9 @@ class ExostreamGUI:
                     'version': version
                 }
                 
-                # Update combo box
-                values = list(self.discovered_services.keys())
-                self.discovered_combo.config(values=values)
+                # Update combo box (periodic re-announcements don't change it)
+                if is_new:
+                    self._update_discovered_combo()
                 
                 if event_type == 'added':
                     self._log(f"Discovered: {name} at {host}:{port}")
@@ -1280,8 +1583,7 @@ class ExostreamGUI:
                 del self.discovered_services[to_remove]
                 
                 # Update combo box
-                values = list(self.discovered_services.keys())
-                self.discovered_combo.config(values=values)
+                self._update_discovered_combo()
                 
                 self._log(f"Lost: {service_data.name}")
 
@@ -0,0 +1,228 @@
+"""
+Device log parsing for the remote GUI
+
+Splits daemon log lines into (text, tag) fragments for colorized display
+in the Device Log tab. Runs in the GUI's worker threads so only the final
+insert happens on the Tk thread.
+
+Plain Python that Cython can compile as-is: when built with Cython
+available (see setup.py) the compiled extension is imported instead of
+this file.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+
+# Level name -> Text widget tag, also used to validate the level field
+LEVEL_TAGS = {level: 'level_' + level.lower() for level in LEVELS}
+
+# Pattern for: Client connected from ('IP', PORT) or ('IP',PORT)
+IP_PORT_PATTERN = re.compile(r"\(['\"]?(\d+\.\d+\.\d+\.\d+)['\"]?,\s*(\d+)\)")
+
+# Parsed lines kept around for re-rendering (a couple of full device log views)
+PARSE_CACHE_SIZE = 4096
+
+Fragment = Tuple[str, Optional[str]]
+
+
+def _is_digits(s: str) -> bool:
+    """Check that a string is non-empty and made of digits only (like \\d+)"""
+    return s.isdecimal()
+
+
+def _append_message(fragments: List[Fragment], message: str):
+    """Append message fragments, highlighting (IP, port) pairs"""
+    # Most messages have no address tuple at all
+    if '(' not in message:
+        fragments.append((message, 'message'))
+        return
+    
+    last_pos = 0
+    for match in IP_PORT_PATTERN.finditer(message):
+        # Text before match
+        if match.start() > last_pos:
+            fragments.append((message[last_pos:match.start()], 'message'))
+        
+        fragments.append(('(', None))
+        fragments.append((match.group(1), 'ip_address'))
+        fragments.append((', ', None))
+        fragments.append((match.group(2), 'port'))
+        fragments.append((')', None))
+        
+        last_pos = match.end()
+    
+    # Remaining text
+    if last_pos < len(message):
+        fragments.append((message[last_pos:], 'message'))
+
+
+def _parse_full_format(fragments: List[Fragment], line: str) -> bool:
+    """
+    Parse "YYYY-MM-DD HH:MM:SS - logger_name - LEVEL - message"
+    
+    Returns:
+        True if the line matched and fragments were appended
+    """
+    # Fixed-width timestamp followed by the first separator
+    if len(line) < 23 or line[19:22] != ' - ':
+        return False
+    if not (line[4] == '-' and line[7] == '-' and line[10] == ' ' and
+            line[13] == ':' and line[16] == ':'):
+        return False
+    if not (_is_digits(line[0:4]) and _is_digits(line[5:7]) and
+            _is_digits(line[8:10]) and _is_digits(line[11:13]) and
+            _is_digits(line[14:16]) and _is_digits(line[17:19])):
+        return False
+    
+    # Logger name runs up to the next separator and contains no dashes
+    logger_end = line.find(' - ', 22)
+    if logger_end <= 22:
+        return False
+    logger_name = line[22:logger_end]
+    if '-' in logger_name:
+        return False
+    
+    level_start = logger_end + 3
+    level_end = line.find(' - ', level_start)
+    if level_end < 0:
+        return False
+    level = line[level_start:level_end]
+    level_tag = LEVEL_TAGS.get(level)
+    if level_tag is None:
+        return False
+    
+    message = line[level_end + 3:]
+    if not message:
+        return False
+    
+    fragments.append((line[0:19], 'timestamp'))
+    fragments.append((' - ', 'separator'))
+    fragments.append((logger_name.strip(), 'logger'))
+    fragments.append((' - ', 'separator'))
+    fragments.append((level, level_tag))
+    fragments.append((' - ', 'separator'))
+    _append_message(fragments, message)
+    return True
+
+
+def _parse_short_format(fragments: List[Fragment], line: str) -> bool:
+    """
+    Parse "[HH:MM:SS] LEVEL message"
+    
+    Returns:
+        True if the line matched and fragments were appended
+    """
+    if len(line) < 13 or line[0] != '[' or line[9:11] != '] ':
+        return False
+    if not (line[3] == ':' and line[6] == ':' and _is_digits(line[1:3]) and
+            _is_digits(line[4:6]) and _is_digits(line[7:9])):
+        return False
+    
+    level_end = line.find(' ', 11)
+    if level_end < 0:
+        return False
+    level = line[11:level_end]
+    level_tag = LEVEL_TAGS.get(level)
+    if level_tag is None:
+        return False
+    
+    message = line[level_end + 1:]
+    if not message:
+        return False
+    
+    fragments.append((line[0:10], 'timestamp'))
+    fragments.append((' ', None))
+    fragments.append((level, level_tag))
+    fragments.append((' ', None))
+    _append_message(fragments, message)
+    return True
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_line(line: str) -> Tuple[Fragment, ...]:
+    """Split one log line into fragments, ending with ('\\n', None)"""
+    fragments: List[Fragment] = []
+    
+    # The first character tells which format (if any) can match, so
+    # plain lines like tracebacks skip both parsers
+    first = line[:1]
+    if first == '[':
+        parsed = _parse_short_format(fragments, line)
+    elif first.isdecimal():
+        parsed = _parse_full_format(fragments, line)
+    else:
+        parsed = False
+    
+    if not parsed:
+        # Plain text line
+        fragments.append((line, None))
+    fragments.append(('\n', None))
+    
+    return tuple(fragments)
+
+
+def parse_lines(lines: List[str]) -> List[Fragment]:
+    """
+    Split log lines into colorized fragments
+    
+    Recently parsed lines are cached, so re-rendering the same lines (after
+    a filter change or when paging in older lines) skips the parsing.
+    
+    Args:
+        lines: Log lines (without trailing newlines)
+    
+    Returns:
+        List of (text, tag) tuples, tag is None for untagged text.
+        Every line ends with a ('\\n', None) fragment.
+    """
+    fragments: List[Fragment] = []
+    extend = fragments.extend
+    
+    for line in lines:
+        extend(_parse_line(line))
+    
+    return fragments
+
+
+def layout_fragments(fragments: List[Fragment],
+                     first_line: int = 1) -> Tuple[str, Dict[str, List[str]]]:
+    """
+    Join fragments into one text blob with Tk tag ranges
+    
+    Lets the GUI do a single insert followed by one tag_add per tag,
+    instead of an insert/index/tag_add round-trip per fragment.
+    
+    Args:
+        fragments: Fragments from parse_lines()
+        first_line: Text widget line the blob will be inserted at (column 0)
+    
+    Returns:
+        Tuple of (blob, ranges) where ranges maps each tag to a flat list
+        of "line.col" start/end indices, ready for tag_add(tag, *ranges)
+    """
+    ranges: Dict[str, List[str]] = {}
+    get_ranges = ranges.get  # Bound once, this loop runs per fragment
+    line = first_line
+    line_prefix = f"{line}."
+    col = 0
+    
+    for text, tag in fragments:
+        if text == '\n':
+            line += 1
+            line_prefix = f"{line}."
+            col = 0
+            continue
+        
+        end_col = col + len(text)
+        if tag:
+            tag_ranges = get_ranges(tag)
+            if tag_ranges is None:
+                tag_ranges = ranges[tag] = []
+            tag_ranges += (line_prefix + str(col), line_prefix + str(end_col))
+        col = end_col
+    
+    blob = ''.join([text for text, tag in fragments])
+    return blob, ranges
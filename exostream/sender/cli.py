@@ -2,18 +2,21 @@
 
 import sys
 import click
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
+from rich.style import Style
+from rich.text import Text
 from rich import box
 
 from exostream.common.logger import setup_logger, get_logger
 from exostream.common.config import StreamConfig, VideoConfig, NDIConfig
-from exostream.common.network import get_local_ip
 from exostream.sender.webcam import WebcamManager
-from exostream.sender.ffmpeg_encoder import FFmpegEncoder
 
-console = Console()
+# Output is already styled via markup, skip rich's auto-highlighting regexes
+console = Console(highlight=False)
+
+ERROR_STYLE = Style(color="red")
 
 
 @click.group()
@@ -40,14 +43,16 @@ def send(device, name, groups, resolution, fps, raw_input, list_devices, verbose
     logger = get_logger(__name__)
     
     # Display banner
-    console.print(Panel.fit(
-        "[bold cyan]Exostream Sender[/bold cyan]\n"
-        "[dim]Streaming webcam over NDI[/dim]",
-        border_style="cyan"
+    console.print(Group(
+        Panel.fit(
+            "[bold cyan]Exostream Sender[/bold cyan]\n"
+            "[dim]Streaming webcam over NDI[/dim]",
+            border_style="cyan"
+        ),
+        Text.from_markup("\n[yellow]Detecting video devices...[/yellow]")
     ))
     
     # Detect webcams
-    console.print("\n[yellow]Detecting video devices...[/yellow]")
     webcam_manager = WebcamManager()
     devices = webcam_manager.detect_devices()
     
@@ -90,15 +95,18 @@ def send(device, name, groups, resolution, fps, raw_input, list_devices, verbose
         console.print(f"[red]✗ Invalid configuration: {e}[/red]")
         sys.exit(1)
     
-    # Display configuration
-    display_stream_config(config)
+    # Display configuration, stream information and notes in a single render
+    output = [stream_config_table(config)]
     
-    # Display NDI stream information
-    console.print(f"\n[bold green]NDI Stream Information:[/bold green]")
-    console.print(f"  Stream Name: [yellow]{config.ndi.stream_name}[/yellow]")
+    # NDI stream information
+    info_lines = [
+        "\n[bold green]NDI Stream Information:[/bold green]",
+        f"  Stream Name: [yellow]{config.ndi.stream_name}[/yellow]"
+    ]
     if config.ndi.groups:
-        console.print(f"  Groups: [yellow]{config.ndi.groups}[/yellow]")
-    console.print(f"  [dim]Discoverable on local network via NDI[/dim]")
+        info_lines.append(f"  Groups: [yellow]{config.ndi.groups}[/yellow]")
+    info_lines.append("  [dim]Discoverable on local network via NDI[/dim]")
+    output.append(Text.from_markup("\n".join(info_lines)))
     
     # Performance note
     if config.video.width >= 1920 and config.video.fps >= 30:
@@ -108,19 +116,21 @@ def send(device, name, groups, resolution, fps, raw_input, list_devices, verbose
             perf_msg += "Remove --raw-input flag for 1080p, or use --resolution 1280x720[/dim]"
         else:
             perf_msg += "If stuttering occurs, reduce resolution: --resolution 1280x720[/dim]"
-        console.print(perf_msg)
+        output.append(Text.from_markup(perf_msg))
     
-    console.print("\n[yellow]Starting stream...[/yellow]")
-    console.print("[dim]Press Ctrl+C to stop[/dim]\n")
+    output.append(Text.from_markup("\n[yellow]Starting stream...[/yellow]\n[dim]Press Ctrl+C to stop[/dim]\n"))
+    console.print(Group(*output))
     
-    # Create and start encoder
+    # Create and start encoder (imported here so --list-devices doesn't load it)
+    from exostream.sender.ffmpeg_encoder import FFmpegEncoder
     try:
         # Use FFmpeg encoder with NDI (raw frame output)
         encoder = FFmpegEncoder(
             device_path=device,
             video_config=config.video,
             ndi_config=config.ndi,
-            on_error=lambda msg: console.print(f"[red]Error: {msg}[/red]"),
+            # FFmpeg messages contain [brackets], print them without markup
+            on_error=lambda msg: console.print(f"Error: {msg}", style=ERROR_STYLE, markup=False),
             use_raw_input=raw_input
         )
         
@@ -149,8 +159,8 @@ def display_devices_table(devices):
     console.print(table)
 
 
-def display_stream_config(config: StreamConfig):
-    """Display streaming configuration"""
+def stream_config_table(config: StreamConfig) -> Table:
+    """Build the streaming configuration table"""
     table = Table(title="Stream Configuration", box=box.ROUNDED, show_header=False)
     table.add_column("Setting", style="cyan")
     table.add_column("Value", style="yellow")
@@ -163,7 +173,7 @@ def display_stream_config(config: StreamConfig):
         table.add_row("Groups", config.ndi.groups)
     table.add_row("Compression", "NDI (automatic)")
     
-    console.print(table)
+    return table
 
 
 if __name__ == '__main__':
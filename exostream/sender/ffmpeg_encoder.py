@@ -2,14 +2,24 @@
 
 import subprocess
 import signal
+import logging
+import fcntl
 import sys
 import shlex
-from typing import Optional, Callable
+import shutil
+from typing import Optional, Callable, List
 from exostream.common.logger import get_logger
 from exostream.common.config import VideoConfig, NDIConfig
 
 logger = get_logger(__name__)
 
+# Substrings of FFmpeg's periodic progress/stats lines
+PROGRESS_MARKERS = ("frame=", "fps=", "bitrate=", "speed=")
+
+# Linux-only fcntl command (exposed by the fcntl module from Python 3.10)
+F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031)
+STDERR_PIPE_SIZE = 1 << 20  # 1 MiB, the default pipe-max-size
+
 
 class FFmpegEncoder:
     """Handles video encoding using FFmpeg with NDI output"""
@@ -65,11 +75,27 @@ class FFmpegEncoder:
             "ffmpeg",
             "-hide_banner",
             "-loglevel", "info",
-            
-            # Input from V4L2 device
-            "-f", "v4l2",
         ]
         
+        # Progress stats are only ever logged at debug level, so unless that's
+        # enabled don't have FFmpeg format and pipe them several times a second
+        if not logger.isEnabledFor(logging.DEBUG):
+            cmd.append("-nostats")
+        
+        # Input side low latency: don't buffer in the demuxer and keep stream
+        # probing short, the format is set explicitly below. Note that
+        # -analyzeduration 0 would mean "use the default" (5 s), hence 0.1 s
+        # (the existing -fflags/-flags further down apply to the output)
+        cmd.extend([
+            "-fflags", "nobuffer",
+            "-flags", "low_delay",
+            "-analyzeduration", "100000",
+            "-probesize", "32",
+        ])
+        
+        # Input from V4L2 device
+        cmd.extend(["-f", "v4l2"])
+        
         # Choose input format based on use_raw_input flag
         if self.use_raw_input:
             # Raw YUYV input - no decoding needed, lower CPU
@@ -134,43 +160,49 @@ class FFmpegEncoder:
     
     def start(self):
         """Start the FFmpeg encoding process"""
-        cmd = self.build_command()
+        cmd = self._scheduling_prefix() + self.build_command()
         
         logger.info(f"Starting FFmpeg encoder...")
-        logger.debug(f"Command: {' '.join(cmd)}")
         
         try:
-            # Start FFmpeg process
+            # Start FFmpeg process (output goes to NDI, nothing is written to stdout)
             self.process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
                 universal_newlines=True,
                 bufsize=1
             )
+            self._grow_stderr_pipe()
             
             logger.info(f"FFmpeg encoder started (PID: {self.process.pid})")
             logger.info(f"NDI stream name: {self.ndi_config.stream_name}")
             if self.ndi_config.groups:
                 logger.info(f"NDI groups: {self.ndi_config.groups}")
-            logger.info(f"Full command: {' '.join(cmd)}")
+            logger.info(f"Full command: {shlex.join(cmd)}")
             
             # Monitor stderr in real-time
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
             try:
                 for line in self.process.stderr:
                     line = line.strip()
+                    if not line:
+                        continue
+                    lowered = line.lower()
                     
                     # Log important FFmpeg messages
-                    if "error" in line.lower() or "failed" in line.lower():
+                    if "error" in lowered or "failed" in lowered:
                         logger.error(f"FFmpeg: {line}")
                         if self.on_error:
                             self.on_error(line)
-                    elif "warning" in line.lower():
+                    elif "warning" in lowered:
                         logger.warning(f"FFmpeg: {line}")
-                    elif any(x in line for x in ["frame=", "fps=", "bitrate=", "speed="]):
-                        # Progress info - only log periodically
-                        logger.debug(f"FFmpeg: {line}")
-                    elif line:
+                    elif any(x in line for x in PROGRESS_MARKERS):
+                        # Progress info arrives several times a second, don't
+                        # even format it unless debug logging is on
+                        if debug_enabled:
+                            logger.debug(f"FFmpeg: {line}")
+                    else:
                         logger.info(f"FFmpeg: {line}")
                 
             except KeyboardInterrupt:
@@ -191,6 +223,42 @@ class FFmpegEncoder:
                 self.on_error(str(e))
             raise
     
+    def _grow_stderr_pipe(self):
+        """Enlarge the stderr pipe so a slow log reader doesn't block FFmpeg's writes"""
+        try:
+            fcntl.fcntl(self.process.stderr.fileno(), F_SETPIPE_SZ, STDERR_PIPE_SIZE)
+        except OSError as e:
+            # Capped by /proc/sys/fs/pipe-max-size, the default size still works
+            logger.debug(f"Could not resize FFmpeg stderr pipe: {e}")
+    
+    def _scheduling_prefix(self) -> List[str]:
+        """
+        Build the nice/taskset prefix for the configured niceness and CPU affinity
+        
+        Wrapping the command (rather than adjusting the PID after Popen) makes
+        every FFmpeg thread inherit the settings, and needs no preexec_fn,
+        which isn't safe to use while the daemon's other threads are running.
+        """
+        prefix = []
+        
+        if self.video_config.nice:
+            if shutil.which("nice"):
+                prefix.extend(["nice", "-n", str(self.video_config.nice)])
+                logger.info(f"FFmpeg niceness: {self.video_config.nice}")
+            else:
+                logger.warning("nice not found, FFmpeg runs at normal priority")
+        
+        if self.video_config.cpu_affinity:
+            # taskset is Linux only (util-linux)
+            if shutil.which("taskset"):
+                cpus = ",".join(str(cpu) for cpu in sorted(self.video_config.cpu_affinity))
+                prefix.extend(["taskset", "-c", cpus])
+                logger.info(f"FFmpeg pinned to CPUs: {cpus}")
+            else:
+                logger.warning("taskset not found, FFmpeg runs on all CPUs")
+        
+        return prefix
+    
     def stop(self):
         """Stop the FFmpeg encoding process"""
         if self.process and self.process.poll() is None:
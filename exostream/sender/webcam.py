@@ -2,12 +2,19 @@
 
 import os
 import glob
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from dataclasses import dataclass
 from exostream.common.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Last enumeration, shared by all managers: (device node signature, devices).
+# The daemon enumerates on every devices.list / settings.get_available call.
+_device_cache: Optional[Tuple[tuple, list]] = None
+
+# Name fragments identifying a Logitech camera (C920 or C930)
+LOGITECH_KEYWORDS = ('logitech', 'c920', 'c930')
+
 
 @dataclass
 class WebcamDevice:
@@ -38,20 +45,39 @@ class WebcamManager:
     
     def __init__(self):
         self.devices: List[WebcamDevice] = []
+        self._by_path: Dict[str, WebcamDevice] = {}
+        self._by_index: Dict[int, WebcamDevice] = {}
     
-    def detect_devices(self) -> List[WebcamDevice]:
+    def detect_devices(self, use_cache: bool = True) -> List[WebcamDevice]:
         """
         Detect all available V4L2 video devices
         
+        The result is reused until a /dev/video* node is added, removed or
+        recreated (e.g. when a camera is replugged).
+        
+        Args:
+            use_cache: Reuse the previous enumeration if the device nodes
+                       haven't changed
+        
         Returns:
             List of WebcamDevice objects
         """
-        self.devices = []
+        global _device_cache
         
         # Find all /dev/video* devices
         video_devices = sorted(glob.glob("/dev/video*"))
         
-        for device_path in video_devices:
+        signature = self._device_signature(video_devices)
+        cache = _device_cache
+        if use_cache and cache is not None and cache[0] == signature:
+            self.devices = list(cache[1])
+            self._index_devices()
+            return self.devices
+        
+        self.devices = []
+        
+        # Nodes in the signature were just stat()ed, so probe only those
+        for device_path, _, _ in signature:
             try:
                 device = self._probe_device(device_path)
                 if device and device.is_capture_device:
@@ -60,8 +86,36 @@ class WebcamManager:
             except Exception as e:
                 logger.warning(f"Failed to probe {device_path}: {e}")
         
+        _device_cache = (signature, list(self.devices))
+        self._index_devices()
         return self.devices
     
+    def _index_devices(self):
+        """Rebuild the path/index lookup tables from self.devices"""
+        self._by_path = {device.path: device for device in self.devices}
+        self._by_index = {device.index: device for device in self.devices}
+    
+    @staticmethod
+    def _device_signature(device_paths: List[str]) -> tuple:
+        """
+        Identify the current set of device nodes
+        
+        Args:
+            device_paths: Sorted /dev/video* paths
+        
+        Returns:
+            Tuple of (path, inode, device number) per node; a replugged
+            camera gets a new inode
+        """
+        signature = []
+        for device_path in device_paths:
+            try:
+                st = os.stat(device_path)
+            except OSError:
+                continue
+            signature.append((device_path, st.st_ino, st.st_rdev))
+        return tuple(signature)
+    
     def _probe_device(self, device_path: str) -> Optional[WebcamDevice]:
         """
         Probe a device to get its information
@@ -72,9 +126,6 @@ class WebcamManager:
         Returns:
             WebcamDevice object or None if probe failed
         """
-        if not os.path.exists(device_path):
-            return None
-        
         # Extract device index
         index = int(device_path.replace("/dev/video", ""))
         
@@ -108,26 +159,20 @@ class WebcamManager:
         """
         info = {}
         
-        try:
-            # Get device name from sysfs
-            device_name = os.path.basename(device_path)
-            sysfs_path = f"/sys/class/video4linux/{device_name}"
-            
-            if os.path.exists(sysfs_path):
-                # Read device name
-                name_file = os.path.join(sysfs_path, "name")
-                if os.path.exists(name_file):
-                    with open(name_file, 'r') as f:
-                        info['name'] = f.read().strip()
-                
-                # Try to read device/modalias for more info
-                modalias_file = os.path.join(sysfs_path, "device/modalias")
-                if os.path.exists(modalias_file):
-                    with open(modalias_file, 'r') as f:
-                        info['modalias'] = f.read().strip()
-        
-        except Exception as e:
-            logger.debug(f"Failed to read sysfs info for {device_path}: {e}")
+        # Get device name from sysfs
+        device_name = os.path.basename(device_path)
+        sysfs_path = f"/sys/class/video4linux/{device_name}"
+        
+        # Just try to open the files, missing ones are skipped (no extra
+        # exists() stat per file)
+        for key, relative_path in (('name', "name"), ('modalias', "device/modalias")):
+            try:
+                with open(os.path.join(sysfs_path, relative_path), 'r') as f:
+                    info[key] = f.read().strip()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.debug(f"Failed to read sysfs {relative_path} for {device_path}: {e}")
         
         return info
     
@@ -141,10 +186,7 @@ class WebcamManager:
         Returns:
             WebcamDevice object or None
         """
-        for device in self.devices:
-            if device.path == path:
-                return device
-        return None
+        return self._by_path.get(path)
     
     def get_device_by_index(self, index: int) -> Optional[WebcamDevice]:
         """
@@ -156,10 +198,7 @@ class WebcamManager:
         Returns:
             WebcamDevice object or None
         """
-        for device in self.devices:
-            if device.index == index:
-                return device
-        return None
+        return self._by_index.get(index)
     
     def find_logitech_camera(self) -> Optional[WebcamDevice]:
         """
@@ -168,11 +207,9 @@ class WebcamManager:
         Returns:
             WebcamDevice object or None
         """
-        logitech_keywords = ['logitech', 'c920', 'c930']
-        
         for device in self.devices:
             device_name_lower = device.name.lower()
-            if any(keyword in device_name_lower for keyword in logitech_keywords):
+            if any(keyword in device_name_lower for keyword in LOGITECH_KEYWORDS):
                 return device
         
         return None
@@ -1,4 +1,25 @@
-from setuptools import setup, find_packages
+import os
+
+from setuptools import setup, find_packages, Extension
+
+# Optional: compile the GUI device-log parser with Cython. Opt in with
+# EXOSTREAM_BUILD_EXT=1 (needs Cython and a C compiler, install with
+# --no-build-isolation); the pure-Python module is used otherwise.
+ext_modules = []
+if os.environ.get("EXOSTREAM_BUILD_EXT") == "1":
+    from Cython.Build import cythonize
+    
+    ext_modules = cythonize(
+        [
+            Extension(
+                "exostream.remote.logparse",
+                ["exostream/remote/logparse.py"],
+                optional=True,
+            )
+        ],
+        compiler_directives={"language_level": 3, "boundscheck": False},
+        quiet=True,
+    )
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -11,6 +32,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -25,6 +47,10 @@ setup(
         "pyyaml>=6.0",
         "psutil>=5.9.0",
     ],
+    extras_require={
+        # Faster JSON-RPC (de)serialization, stdlib json is used without it
+        "fast": ["orjson>=3.6"],
+    },
     entry_points={
         "console_scripts": [
             "exostream=exostream.cli.main:cli",